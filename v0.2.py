@@ -1,15 +1,31 @@
 # ───────────────────────────────────────────
 # Standard Library Imports
 # ───────────────────────────────────────────
+import argparse
 import configparser
+import csv
+import hashlib
+import importlib
+import io
+import json
+import mmap
 import os
 import platform
+import queue
 import random
+import re
 import shutil
+import sqlite3
 import ssl
 import subprocess
+import sys
 import tempfile
 import threading
+import time
+import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 # ───────────────────────────────────────────
 # Tkinter GUI Toolkit Imports
 # ───────────────────────────────────────────
@@ -22,33 +38,164 @@ from tkinter import (
 # ───────────────────────────────────────────
 # Third-Party Library Imports
 # ───────────────────────────────────────────
-import certifi
-import cv2
 import pyxdelta
-import requests
-import simpleaudio as sa
-from PIL import Image, ImageTk, ImageSequence
-from bs4 import BeautifulSoup
-# ───────────────────────────────────────────
-# GameBanana API Import
-# ───────────────────────────────────────────
-from pybanana.api import PyBanana
-from requests.adapters import HTTPAdapter
+
+
+class LazyModule:
+    """
+    Stands in for a module and imports it on first attribute access.
+    Keeps heavy dependencies out of startup until a page or command actually uses them.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# Only needed by thumbnails, Glooby, sounds and mod conversion
+bs4 = LazyModule("bs4")
+certifi = LazyModule("certifi")
+cv2 = LazyModule("cv2")
+requests = LazyModule("requests")
+sa = LazyModule("simpleaudio")
+Image = LazyModule("PIL.Image")
+ImageTk = LazyModule("PIL.ImageTk")
+ImageSequence = LazyModule("PIL.ImageSequence")
 # ───────────────────────────────────────────
-# Web Automation (Selenium) Imports
+# GameBanana API and Web Automation (Selenium)
+# are imported inside get_api() and create_driver()
 # ───────────────────────────────────────────
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 # ───────────────────────────────────────────
 # Setup
 # ───────────────────────────────────────────
 current_dir = os.path.dirname(os.path.abspath(__file__))
-context = ssl.create_default_context(cafile=certifi.where())
-api = PyBanana()
+HEAVY_MODULES = ("bs4", "certifi", "cv2", "PIL", "pybanana", "requests", "selenium", "simpleaudio")
+
+_api = None
+_ssl_context = None
+
+
+def get_api():
+    """Returns the shared GameBanana API client, importing pybanana on first use."""
+    global _api
+    if _api is None:
+        from pybanana.api import PyBanana
+        _api = PyBanana()
+    return _api
+
+
+def get_ssl_context():
+    """Returns the shared SSL context built from certifi's CA bundle."""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return _ssl_context
+
+
+# ────────────────
+# HTTP Client
+# ────────────────
+# Every request to GameBanana and its image hosts goes through one pooled session, so connections
+# and TLS handshakes are reused. Set SPLIT_GAMEBANANA_URL to point the app at a local test server.
+GAMEBANANA_URL = os.environ.get("SPLIT_GAMEBANANA_URL", "https://gamebanana.com").rstrip("/")
+HTTP_TIMEOUT = (5, 15)  # connect, read
+HTTP_RETRIES = 3
+HTTP_BACKOFF = 0.5  # 0.5 s, 1 s, 2 s between retries
+HTTP_POOL_SIZE = 16
+HTTP_HOST_LIMIT = 4  # concurrent requests per host
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+_http_session = None
+_http_lock = threading.Lock()
+_host_slots = {}
+
+
+def get_http_session():
+    """Returns the shared requests session with keep-alive pooling, retries and the certifi SSL context."""
+    global _http_session
+    with _http_lock:
+        if _http_session is None:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            class SSLAdapter(HTTPAdapter):
+                def __init__(self, ssl_context=None, **kwargs):
+                    self.ssl_context = ssl_context
+                    super().__init__(**kwargs)
+
+                def init_poolmanager(self, *args, **kwargs):
+                    kwargs["ssl_context"] = self.ssl_context
+                    return super().init_poolmanager(*args, **kwargs)
+
+            retry = Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True
+            )
+            session = requests.Session()
+            session.headers.update(HTTP_HEADERS)
+            session.mount("https://", SSLAdapter(
+                ssl_context=get_ssl_context(), max_retries=retry,
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            ))
+            session.mount("http://", HTTPAdapter(
+                max_retries=retry, pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+            ))
+            _http_session = session
+        return _http_session
+
+
+def _host_slot(url):
+    """Returns the semaphore limiting concurrent requests to url's host."""
+    host = urlsplit(url).netloc
+    with _http_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(HTTP_HOST_LIMIT)
+        return _host_slots[host]
+
+
+def gamebanana_url(path):
+    """Builds a GameBanana URL from a path like /mods/123, honouring SPLIT_GAMEBANANA_URL."""
+    return f"{GAMEBANANA_URL}/{path.lstrip('/')}"
+
+
+def http_get(url, **kwargs):
+    """GETs url through the shared session and returns the response. Raises on network or HTTP errors."""
+    session = get_http_session()
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    with _host_slot(url):
+        response = session.get(url, **kwargs)
+        response.raise_for_status()
+        response.content  # Read the body while holding the slot so the connection goes back to the pool
+    return response
+
+
+def http_download(url, output_path, chunk_size=64 * 1024):
+    """
+    Streams url into output_path through a temp file, so a failed download never leaves a partial file.
+    Raises on network or HTTP errors.
+    """
+    session = get_http_session()
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, _host_slot(url):
+            with session.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
 
 # ────────────────
 # Utility Functions
@@ -57,9 +204,12 @@ TIMEOUT_DELAY = 3
 
 
 class LoadingScreen(tk.Toplevel):
-    def __init__(self, master, total_steps):
+    def __init__(self, master, total_steps, title="Loading Split Modding Program...", hide_on_close=False):
         super().__init__(master)
-        self.title("Loading Split Modding Program...")
+        self.title(title)
+        if hide_on_close:
+            # Long-running dialogs are only hidden by the close button; whoever opened them destroys them when done
+            self.protocol("WM_DELETE_WINDOW", self.withdraw)
         self.geometry("500x250")
         self.resizable(False, False)
 
@@ -82,57 +232,80 @@ class LoadingScreen(tk.Toplevel):
         self.update_idletasks()
 
 
-def process_mod(ini_id, mod_dir, splash: LoadingScreen):
+MOD_INI_FIELDS = ("name", "description", "video_link", "author", "date_made", "like_count", "download_count", "link")
+
+
+def profile_to_mod_info(mod_id, mod):
+    """Maps a GameBanana mod profile onto the mod.ini fields."""
+    submitter = profile_attr(mod, "submitter")
+    base = profile_attr(mod, "base")
+
+    date_made = ""
+    date_added = profile_attr(base, "date_added") or profile_attr(mod, "date_added")
+    if date_added:
+        try:
+            date_made = date_added.strftime("%Y-%m-%d")
+        except Exception:
+            date_made = ""
+
+    return {
+        "name": profile_attr(mod, "name") or profile_attr(base, "name") or "",
+        "description": bs4.BeautifulSoup(profile_attr(mod, "text") or "", "html.parser").get_text().strip(),
+        "video_link": "",
+        "author": profile_attr(submitter, "name") or "",
+        "date_made": date_made,
+        "like_count": str(profile_attr(mod, "like_count") or 0),
+        "download_count": str(profile_attr(mod, "download_count") or 0),
+        "link": f"https://gamebanana.com/mods/{mod_id}"
+    }
+
+
+def write_mod_ini(mod_dir, mod_info, fields=MOD_INI_FIELDS):
+    """
+    Writes the given fields of mod_info into mod_dir/mod.ini, keeping any other keys already there (like version).
+    Values are escaped for configparser so descriptions with % or several lines read back intact.
+    """
+    ini_path = os.path.join(mod_dir, "mod.ini")
+    config = configparser.RawConfigParser()
+    config.optionxform = str
+    config.read(ini_path, encoding="utf-8")
+    if not config.has_section("Mod"):
+        config.add_section("Mod")
+    for key in fields:
+        config.set("Mod", key, str(mod_info.get(key, "")).replace("%", "%%"))
+
+    fd, temp_path = tempfile.mkstemp(dir=mod_dir, suffix=".tmp")
     try:
-        splash.log("Creating GameBanana API interface...")
-        api = PyBanana()
-        splash.update_progress(1)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            config.write(f)
+        os.replace(temp_path, ini_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return ini_path
 
+
+def process_mod(ini_id, mod_dir, splash: LoadingScreen):
+    try:
         splash.log(f"Fetching mod profile for ID {ini_id}...")
-        mod = api.get_mod_profile(int(ini_id))
+        splash.update_progress(1)
+        mod_info = fetch_profile_info(ini_id)
         splash.update_progress(2)
 
-        name = mod.name or ""
-        author = mod.submitter.name if mod.submitter else ""
-        description = BeautifulSoup(mod.text or "", "html.parser").get_text().strip()
-        video_link = ""
-        date_made = ""
-        if mod.base and mod.base.date_added:
-            try:
-                date_made = mod.base.date_added.strftime("%Y-%m-%d")
-            except Exception:
-                date_made = ""
-        like_count = str(mod.like_count or 0)
-        download_count = str(mod.download_count or 0)
-        link = f"https://gamebanana.com/mods/{ini_id}"
-
         splash.log("Writing mod.ini file...")
-        with open(os.path.join(mod_dir, "mod.ini"), "w", encoding="utf-8") as f:
-            f.write("[Mod]\n")
-            f.write(f"name = {name}\n")
-            f.write(f"description = {description}\n")
-            f.write(f"video_link = {video_link}\n")
-            f.write(f"author = {author}\n")
-            f.write(f"date_made = {date_made}\n")
-            f.write(f"like_count = {like_count}\n")
-            f.write(f"download_count = {download_count}\n")
-            f.write(f"link = {link}\n")
+        write_mod_ini(mod_dir, mod_info)
         splash.update_progress(3)
 
-        splash.log("Starting browser to fetch thumbnail...")
-        driver = create_driver()
+        splash.log("Finding thumbnail URL...")
+        thumb_url = mod_info.get("thumbnail_url") or resolve_thumbnail_url(ini_id, log=splash.log)
         splash.update_progress(4)
 
-        splash.log("Fetching first thumbnail URL (this may take a while)...")
-        thumb_url = get_first_thumbnail(driver, ini_id)
-        driver.quit()
-        splash.update_progress(5)
-
         if thumb_url:
             splash.log(f"Downloading thumbnail from: {thumb_url}")
             download_thumbnail(thumb_url, os.path.join(mod_dir, "thumbnail.jpg"))
         else:
             splash.log("No thumbnail found.")
+        splash.update_progress(5)
 
         splash.update_progress(6)
         splash.log("Process complete!")
@@ -143,6 +316,9 @@ def process_mod(ini_id, mod_dir, splash: LoadingScreen):
 
 
 def create_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
@@ -150,8 +326,12 @@ def create_driver():
 
 
 def get_first_thumbnail(driver, mod_id):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     try:
-        url = f"https://gamebanana.com/mods/{mod_id}"
+        url = gamebanana_url(f"/mods/{mod_id}")
         driver.get(url)
         WebDriverWait(driver, TIMEOUT_DELAY).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "#ScreenshotsModule a img"))
@@ -163,14 +343,125 @@ def get_first_thumbnail(driver, mod_id):
         return None
 
 
+def profile_attr(obj, name, default=None):
+    """
+    Reads an optional field from a pybanana model (or a raw apiv11 dict). Some pybanana versions
+    recurse forever in __getattr__ on a missing name, so only instance fields and names the class
+    actually defines are looked up; anything missing or broken returns default.
+    """
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    try:
+        fields = vars(obj)
+    except TypeError:
+        fields = {}
+    if name in fields:
+        return fields[name]
+    if hasattr(type(obj), name):
+        try:
+            return getattr(obj, name)
+        except Exception:
+            return default
+    return default
+
+
+def _media_image_url(image):
+    """Returns the URL of a preview image given as a pybanana object or a raw apiv11 dict, or None."""
+    if isinstance(image, dict):
+        url = image.get("_sUrl")
+        base, file = image.get("_sBaseUrl"), image.get("_sFile")
+    else:
+        url = profile_attr(image, "url")
+        base, file = profile_attr(image, "base_url"), profile_attr(image, "file")
+    if url:
+        return url
+    if base and file:
+        return f"{base.rstrip('/')}/{file}"
+    return None
+
+
+def _first_media_url(media):
+    """Returns the first usable image URL in preview media (a pybanana PreviewMedia or an apiv11 dict)."""
+    images = (media.get("_aImages") if isinstance(media, dict) else profile_attr(media, "images")) or []
+    for image in images:
+        url = _media_image_url(image)
+        if url:
+            return url
+    return None
+
+
+def profile_thumbnail_url(mod):
+    """
+    Returns the first preview image URL from a mod profile, or None.
+    Read defensively since pybanana versions differ in where they put preview media. Note that
+    pybanana 0.5's PreviewMediaImage keeps only _sUrl, which apiv11 doesn't send, so with it this
+    finds nothing and resolve_thumbnail_url falls through to the raw profile JSON.
+    """
+    for owner in (mod, profile_attr(mod, "base")):
+        url = _first_media_url(profile_attr(owner, "preview_media"))
+        if url:
+            return url
+    return None
+
+
+def fetch_preview_image_url(mod_id):
+    """
+    Reads the first preview image straight from the mod's apiv11 profile JSON, which carries the
+    _sBaseUrl/_sFile pairs pybanana drops. Returns None if there is none or the request fails.
+    """
+    try:
+        response = http_get(gamebanana_url(f"/apiv11/Mod/{int(mod_id)}/ProfilePage"))
+        return _first_media_url(response.json().get("_aPreviewMedia") or {})
+    except Exception as e:
+        print(f"Failed to fetch preview media: {e}")
+        return None
+
+
+def parse_thumbnail_url(html):
+    """Finds the thumbnail URL in a GameBanana mod page: its og:image tag, else the first screenshot. Returns None if neither exists."""
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    tag = soup.find("meta", property="og:image")
+    if tag and tag.get("content"):
+        return tag["content"]
+    img = soup.select_one("#ScreenshotsModule a img")
+    if img and img.get("src"):
+        return img["src"]
+    return None
+
+
+def resolve_thumbnail_url(mod_id, profile=None, log=print):
+    """
+    Finds a mod's thumbnail URL the cheapest way available: the profile's preview media, then the raw
+    apiv11 profile JSON, then a plain fetch of the mod page. A headless browser is only used if
+    browser_thumbnails is enabled in split.ini.
+    """
+    url = profile_thumbnail_url(profile) if profile is not None else None
+    if url:
+        return url
+
+    url = fetch_preview_image_url(mod_id)
+    if url:
+        return url
+
+    url = mod_thumbnail(mod_id)
+    if url:
+        return url
+
+    if load_split_config().getboolean("Network", "browser_thumbnails", fallback=False):
+        log("Starting browser to fetch thumbnail...")
+        driver = create_driver()
+        try:
+            return get_first_thumbnail(driver, mod_id)
+        finally:
+            driver.quit()
+    return None
+
+
 def download_thumbnail(url, output_path):
     try:
-        with requests.get(url, stream=True, timeout=10) as r:
-            r.raise_for_status()
-            with open(output_path, 'wb') as f:
-                for chunk in r.iter_content(chunk_size=1024):
-                    if chunk:
-                        f.write(chunk)
+        http_download(url, output_path)
         print(f"Downloaded thumbnail to: {output_path}")
     except Exception as e:
         print(f"Download failed: {e}")
@@ -220,18 +511,30 @@ def make_compatible():
     threading.Thread(target=threaded_task, daemon=True).start()
 
 
-def is_patch_valid(source_path, patch_path):
+def apply_patch(source_path, patch_path, output_path=None, expected_sha256=None):
     """
-    Tests if a patch can be successfully applied to a source file.
-    Returns True if valid, False if decoding fails.
+    Validates and applies an xdelta patch in a single decode.
+    The output is written to a temp file next to output_path (defaults to source_path)
+    and only renamed into place once decoding succeeds and, if expected_sha256 is given,
+    the output hash matches. A failed patch leaves the original untouched.
+    Returns True if the patch was applied, False if decoding or verification fails.
     """
-    fd, temp_output_path = tempfile.mkstemp()
+    output_path = output_path or source_path
+    fd, temp_output_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_path)), suffix=".tmp")
     os.close(fd)
 
     try:
-        pyxdelta.decode(source_path, patch_path, temp_output_path)
+        # pyxdelta reports a bad source or patch by returning False
+        if not pyxdelta.decode(source_path, patch_path, temp_output_path):
+            return False
+        if expected_sha256 and file_hash(temp_output_path) != expected_sha256:
+            print(f"Patched output of {os.path.basename(patch_path)} does not match the mod manifest.")
+            return False
+        shutil.copymode(source_path, temp_output_path)  # mkstemp files are private, keep the exe runnable
+        os.replace(temp_output_path, output_path)
         return True
-    except Exception:
+    except Exception as e:
+        print(f"Failed patch: {e}")
         return False
     finally:
         if os.path.exists(temp_output_path):
@@ -258,262 +561,2380 @@ def default_mod_values():
 
 def mod_thumbnail(mod_id):
     """
-    Fetches the GameBanana thumbnail URL for a given mod ID using the og:image meta tag.
+    Fetches the GameBanana thumbnail URL for a given mod ID from its page, without a browser.
+    Returns the URL, or None if it can't be found.
     """
-
-    class SSLAdapter(HTTPAdapter):
-        def __init__(self, ssl_context=None, **kwargs):
-            self.ssl_context = ssl_context
-            super().__init__(**kwargs)
-
-        def init_poolmanager(self, *args, **kwargs):
-            kwargs["ssl_context"] = self.ssl_context
-            return super().init_poolmanager(*args, **kwargs)
-
-    context = ssl.create_default_context(cafile=certifi.where())
-    session = requests.Session()
-    session.mount("https://", SSLAdapter(ssl_context=context))
-
-    url = f"https://gamebanana.com/mods/{mod_id}"
-    headers = {"User-Agent": "Mozilla/5.0"}
-
     try:
-        response = session.get(url, headers=headers)
-        soup = BeautifulSoup(response.content, "html.parser")
-        thumbnail_tag = soup.find("meta", property="og:image")
-
-        if thumbnail_tag and thumbnail_tag.get("content"):
-            print("Thumbnail URL:", thumbnail_tag["content"])
-        else:
-            print("Thumbnail not found.")
+        response = http_get(gamebanana_url(f"/mods/{mod_id}"))
+        url = parse_thumbnail_url(response.content)
+        if url:
+            print("Thumbnail URL:", url)
+            return url
+        print("Thumbnail not found.")
     except Exception as e:
         print(f"Failed to fetch thumbnail: {e}")
+    return None
 
 
 def create_faded_image(path, fade_factor=0.3, size=(700, 250)):
     """
     Loads an image, resizes it, and applies a transparency fade.
+    The faded result is served from the image cache on later launches.
     Returns a PhotoImage ready for Tkinter use.
     """
     try:
-        image = Image.open(path).convert("RGBA").resize(size, Image.LANCZOS)
-        alpha = image.split()[3]
-        alpha = alpha.point(lambda p: int(p * fade_factor))
-        image.putalpha(alpha)
-        return ImageTk.PhotoImage(image)
+        return ImageTk.PhotoImage(load_cached_image(path, size, fade_factor))
     except Exception as e:
         print(f"Image loading failed: {e}")
         return None
 
 
-def add_scrolling_background(parent_frame, image_path, canvas_size=(1280, 720), scroll_speed=1):
+BACKGROUND_SCROLL_SPEED = 50  # pixels per second
+DEFAULT_BACKGROUND_FPS = 50
+
+
+class ScrollingBackground:
     """
-    Adds a horizontally scrolling background to a given frame.
-    Returns the canvas and PhotoImage to retain a reference.
+    One decoded background image shared by every page that scrolls it.
+    The image is scaled once to the canvas height and tiled across each page's canvas, and its scroll
+    position comes from the clock, so pages stay in step and only the page on screen does any work.
     """
-    try:
-        # Ensure the image is wide enough to scroll
-        image = Image.open(image_path).resize((canvas_size[0] * 2, canvas_size[1]), Image.LANCZOS)
-        photo = ImageTk.PhotoImage(image)
 
+    _shared = {}
+
+    def __init__(self, image_path, height, fps=None):
+        image = Image.open(image_path).convert("RGB")
+        if image.height != height:
+            image = image.resize((max(1, round(image.width * height / image.height)), height), Image.LANCZOS)
+        self.photo = ImageTk.PhotoImage(image)
+        self.width = image.width
+
+        if fps is None:
+            fps = load_split_config().getint("Display", "background_fps", fallback=DEFAULT_BACKGROUND_FPS)
+        self.interval_ms = max(1, round(1000 / max(1, fps)))
+        self.start_time = time.perf_counter()
+
+    @classmethod
+    def shared(cls, image_path, height):
+        """Returns the renderer for image_path at height, decoding it the first time it's asked for."""
+        key = (os.path.abspath(image_path), height)
+        if key not in cls._shared:
+            cls._shared[key] = cls(image_path, height)
+        return cls._shared[key]
+
+    def attach(self, parent_frame, canvas_size=(1280, 720), speed=BACKGROUND_SCROLL_SPEED):
+        """Adds a canvas showing the background to parent_frame and scrolls it while that page is shown."""
         canvas = tk.Canvas(parent_frame, width=canvas_size[0], height=canvas_size[1], highlightthickness=0)
         canvas.place(x=0, y=0, relwidth=1, relheight=1)
 
-        image_item = canvas.create_image(0, 0, image=photo, anchor="nw")
+        # Enough copies side by side that the canvas is always covered while they slide left and wrap
+        tiles = [
+            canvas.create_image(i * self.width, 0, image=self.photo, anchor="nw")
+            for i in range(-(-canvas_size[0] // self.width) + 1)
+        ]
 
         def scroll():
-            canvas.move(image_item, -scroll_speed, 0)
-            x, _ = canvas.coords(image_item)
+            offset = ((time.perf_counter() - self.start_time) * speed) % self.width
+            for i, item in enumerate(tiles):
+                canvas.coords(item, i * self.width - offset, 0)
 
-            if x <= -canvas_size[0]:
-                canvas.coords(image_item, 0, 0)
+        scroll()
+        page_timers.every(parent_frame, self.interval_ms, scroll)
+        return canvas
 
-            parent_frame.after(20, scroll)
 
-        scroll()  # Start scrolling animation
-        return canvas, photo
+def add_scrolling_background(parent_frame, image_path, canvas_size=(1280, 720), scroll_speed=BACKGROUND_SCROLL_SPEED):
+    """
+    Adds a horizontally scrolling background to a given frame.
+    Returns the canvas and the shared PhotoImage to retain a reference.
+    """
+    try:
+        background = ScrollingBackground.shared(image_path, canvas_size[1])
+        return background.attach(parent_frame, canvas_size, scroll_speed), background.photo
     except Exception as e:
         print(f"Failed to load background: {e}")
         return None, None
 
 
-# ─────────────
-# Main UI Classes
-# ─────────────
+# ────────────────
+# Settings File
+# ────────────────
+SPLIT_INI_PATH = os.path.join(current_dir, "split.ini")
 
-class MainPage(tk.Frame):
-    def __init__(self, parent, controller):
-        super().__init__(parent, bg="grey")
-        self.controller = controller
 
-        # ────────────────────────────
-        # Title Label
-        # ────────────────────────────
-        title_label = tk.Label(
-            self,
-            text="Split Modding Program",
-            font=("Arial", 35, "bold"),
-            anchor="nw",
-            fg="black",
-            bg="grey",
-            padx=15,
-            pady=15
-        )
-        title_label.place(x=0, y=0)
+def load_split_config():
+    """Reads split.ini from the script directory. Returns an empty config if it doesn't exist."""
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config.read(SPLIT_INI_PATH)
+    return config
 
-        # ────────────────────────────
-        # Load Banner Images
-        # ────────────────────────────
-        self.loader_img = create_faded_image(os.path.join(current_dir, "assets", "examplebanner.jpg"))
-        self.browser_img = create_faded_image(os.path.join(current_dir, "assets", "banner_dummy.png"))
-        self.settings_img = create_faded_image(
-            os.path.join(current_dir, "assets", "examplebanner.jpg"),
-            size=(300, 400)
-        )
 
-        # ────────────────────────────
-        # Button Style Defaults
-        # ────────────────────────────
-        button_font = ("Arial", 20, "bold")
-        button_opts = {
-            "font": button_font,
-            "compound": "center",
-            "borderwidth": 0,
-            "highlightthickness": 0
-        }
+# ────────────────
+# Mod Catalog
+# ────────────────
+MODS_PATH = os.path.join(current_dir, "mods")
+THUMBNAIL_SIZE = (400, 250)
+CACHE_DIR = os.path.join(current_dir, "cache")
+CATALOG_PATH = os.path.join(CACHE_DIR, "mod_catalog.json")
+CATALOG_VERSION = 1
 
-        # ────────────────────────────
-        # Mod Loader Button
-        # ────────────────────────────
-        button_loader = tk.Button(
-            self,
-            image=self.loader_img,
-            text="Mod Loader",
-            command=lambda: controller.show_frame("ModLoader"),
-            **button_opts
-        )
-        button_loader.place(x=20, y=100)
 
-        # ────────────────────────────
-        # Mod Browser Button
-        # ────────────────────────────
-        button_browser = tk.Button(
-            self,
-            image=self.browser_img,
-            text="Mod Browser",
-            # command=lambda: controller.show_frame("ModBrowser")
-            command=lambda: messagebox.showinfo(message="This feature has not yet been implemented."),
-            **button_opts
-        )
-        button_browser.place(x=20, y=400)
+def find_mod_ini(mod_path):
+    """Returns the first mod.ini found under mod_path, or None."""
+    for root, dirs, files in os.walk(mod_path):
+        for file in files:
+            if file.lower() == "mod.ini":
+                return os.path.join(root, file)
+    return None
 
-        # ────────────────────────────
-        # Settings Button
-        # ────────────────────────────
-        button_settings = tk.Button(
-            self,
-            image=self.settings_img,
-            text="Settings",
-            command=lambda: controller.show_frame("Settings"),
-            **button_opts
-        )
-        button_settings.place(x=900, y=100)
 
-        # ────────────────────────────
-        # Sound Buttons with Custom Handlers
-        # ────────────────────────────
-        def play_sound_and_switch(frame_name, sound_file):
-            """Helper to switch frame and play associated sound."""
-            controller.show_frame(frame_name)
-            wave_path = os.path.join(current_dir, f"Assets/{sound_file}")
-            try:
-                wave_obj = sa.WaveObject.from_wave_file(wave_path)
-                wave_obj.play()
-            except Exception as e:
-                print(f"Failed to play sound: {e}")
+def parse_mod_ini(ini_path, mod_path):
+    """
+    Builds a mod metadata dictionary from a mod.ini file.
+    Falls back to placeholder values when the file or its [Mod] section is missing.
+    """
+    mod_info = {
+        "name": "Unknown Mod",
+        "description": "",
+        "video_link": "",
+        "author": "",
+        "date_made": "",
+        "version": "",
+        "like_count": 0,
+        "game_version": "",
+        "download_count": 0,
+        "link": ""
+    }
 
-        # Groovy Button
-        button_groovy = tk.Button(
-            self,
-            text="Groovy",
-            command=lambda: play_sound_and_switch("Groovy", "tvtime.wav"),
-            **button_opts
-        )
-        button_groovy.place(x=900, y=500)
+    if not ini_path or not os.path.exists(ini_path):
+        return mod_info
 
-        # Glooby Button
-        button_glooby = tk.Button(
-            self,
-            text="Glooby",
-            command=lambda: play_sound_and_switch("Glooby", "didntpush.wav"),
-            **button_opts
-        )
-        button_glooby.place(x=1100, y=500)
+    config = configparser.ConfigParser()
+    config.optionxform = str  # Preserve case sensitivity
+    config.read(ini_path)
 
+    if config.has_section("Mod"):
+        get = lambda key, fallback="": config.get("Mod", key, fallback=fallback)
+        getint = lambda key, fallback=0: int(config.get("Mod", key, fallback=str(fallback)) or fallback)
 
-class ModLoader(tk.Frame):
-    def __init__(self, parent, controller):
-        super().__init__(parent, bg="white")
-        self.controller = controller
+        mod_info.update({
+            "name": get("name", "Unknown Mod"),
+            "description": get("description"),
+            "video_link": get("video_link"),
+            "author": get("author"),
+            "date_made": get("date_made"),
+            "version": get("version"),
+            "like_count": getint("like_count"),
+            "game_version": get("game_version"),
+            "download_count": getint("download_count"),
+            "link": get("link"),
+            "mod_path": mod_path
+        })
 
-        # ────────────────
-        # Background Setup
-        # ────────────────
-        self.bg_canvas = tk.Canvas(self, width=1280, height=720, highlightthickness=0)
-        self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
+    return mod_info
 
-        bg_path = os.path.join(current_dir, "assets", "background.jpg")
-        self.bg_canvas, self.bg_photo = add_scrolling_background(self, bg_path)
 
-        # ────────────────
-        # Config
-        # ────────────────
-        self.current_page = 0
-        self.mods_per_page = 6
-        self.thumbnail_size = (400, 250)
-        self.mods_path = os.path.join(current_dir, "mods")
-        self.mod_data = self.load_mods()
+def _stat_key(path):
+    """Returns the [mtime_ns, size] pair used to detect changed files."""
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
 
-        # ────────────────
-        # Title
-        # ────────────────
-        title_label = tk.Label(
-            self,
-            text="Mod Loader Page",
-            font=("Arial", 35, "bold"),
-            fg="black",
-            bg="white",
-            anchor="nw",
-            padx=15,
-            pady=15
-        )
-        title_label.place(x=0, y=0)
 
-        # ────────────────
-        # Back Button
-        # ────────────────
-        back_btn = tk.Button(
-            self,
-            text="Back",
-            font=("Arial", 20),
-            command=lambda: controller.show_frame("MainPage")
-        )
-        back_btn.place(x=1100, y=28)
+def load_mod_catalog(path=None):
+    """
+    Reads the on-disk mod catalog.
+    Returns an empty catalog if the file is missing, corrupt or from another version.
+    """
+    path = path or CATALOG_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        # ────────────────
-        # Mod Button Grid Container
-        # ────────────────
-        self.button_frame = tk.Frame(self, bg="white")
-        self.button_frame.place(relx=0.5, rely=0.5, anchor="center")
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return {}
+    return data.get("mods", {})
 
-        # ────────────────
-        # Navigation Arrows
-        # ────────────────
-        self.prev_btn = tk.Button(
-            self,
-            text="←",
-            font=("Arial", 20),
-            command=self.prev_page
+
+def save_mod_catalog(entries, path=None):
+    """Writes the mod catalog atomically so a crash never leaves a half-written file."""
+    path = path or CATALOG_PATH
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOG_VERSION, "mods": entries}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"Failed to save mod catalog: {e}")
+
+
+def scan_mod_folder(mod_path, entry=None):
+    """
+    Returns an up-to-date catalog entry for a single mod folder.
+    The cached entry is reused when the folder mtime and the mod.ini mtime/size are unchanged.
+    Folders without a mod.ini are walked again every time, since adding one to a subfolder
+    does not change the top-level folder mtime.
+    """
+    dir_mtime = os.stat(mod_path).st_mtime_ns
+    ini_path = None
+
+    if entry and entry.get("dir_mtime") == dir_mtime:
+        if entry.get("ini_path") is None:
+            ini_path = find_mod_ini(mod_path)
+            if ini_path is None:
+                return entry
+        else:
+            try:
+                if _stat_key(entry["ini_path"]) == entry.get("ini_stat"):
+                    return entry
+            except OSError:
+                pass  # mod.ini was removed, rescan below
+
+    ini_path = ini_path or find_mod_ini(mod_path)
+    image_path = os.path.join(mod_path, "thumbnail.jpg")
+
+    return {
+        "dir_mtime": dir_mtime,
+        "ini_path": ini_path,
+        "ini_stat": _stat_key(ini_path) if ini_path else None,
+        "thumbnail": image_path if os.path.exists(image_path) else None,
+        "info": parse_mod_ini(ini_path, mod_path)
+    }
+
+
+SCAN_WORKERS = os.cpu_count() or 4
+
+
+def _scan_mod_worker(mod_path, entry, thumbnail_size):
+    """Scans one mod folder on a worker thread and pre-renders its thumbnail into the image cache."""
+    entry = scan_mod_folder(mod_path, entry)
+    if thumbnail_size and entry["thumbnail"]:
+        try:
+            load_cached_image(entry["thumbnail"], thumbnail_size)
+        except Exception:
+            pass  # Bad images are skipped again when displayed
+    return entry
+
+
+def scan_mods(mods_path, on_mod=None, thumbnail_size=None):
+    """
+    Returns metadata for every mod folder in mods_path, in directory listing order.
+    Unchanged folders are served from the catalog, changed folders are re-parsed
+    and folders that no longer exist are dropped from the catalog.
+
+    Folders are scanned on a pool of SCAN_WORKERS threads. If on_mod is given it is
+    called from the worker side as on_mod(index, mod_info) as soon as each folder is
+    ready. If thumbnail_size is given, thumbnails are also pre-rendered into the image cache.
+    """
+    if not os.path.exists(mods_path):
+        return []
+
+    catalog = load_mod_catalog()
+    mod_paths = [
+        os.path.join(mods_path, mod_dir) for mod_dir in os.listdir(mods_path)
+        if os.path.isdir(os.path.join(mods_path, mod_dir))
+    ]
+
+    entries = {}
+    mods = {}
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        futures = {
+            pool.submit(_scan_mod_worker, mod_path, catalog.get(mod_path), thumbnail_size): index
+            for index, mod_path in enumerate(mod_paths)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            mod_path = mod_paths[index]
+            try:
+                entry = future.result()
+                entries[mod_path] = entry
+                mod_info = dict(entry["info"])
+                mod_info["thumbnail"] = entry["thumbnail"]
+            except Exception as e:
+                # A bad mod.ini (e.g. a raw % in the description) shouldn't sink the whole scan.
+                # Show the folder under its own name and leave it out of the catalog so it's retried.
+                print(f"Failed to scan {os.path.basename(mod_path)}: {e}")
+                mod_info = parse_mod_ini(None, mod_path)
+                mod_info.update({"name": os.path.basename(mod_path), "mod_path": mod_path, "thumbnail": None})
+
+            mods[index] = mod_info
+            if on_mod:
+                on_mod(index, mod_info)
+
+    if entries != catalog:
+        save_mod_catalog(entries)
+
+    return [mods[index] for index in sorted(mods)]
+
+
+# ────────────────
+# Image Cache
+# ────────────────
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "images")
+IMAGE_CACHE_LIMIT = 64 * 1024 * 1024  # bytes
+
+_image_cache_usage = None
+_image_cache_lock = threading.Lock()
+
+
+def touch_cache_entry(path):
+    """
+    Marks a cache file as recently used by bumping its access time.
+    The mtime is left alone so hashes cached for the file stay valid.
+    """
+    st = os.stat(path)
+    os.utime(path, ns=(time.time_ns(), st.st_mtime_ns))
+
+
+def cache_dir_entries(directory):
+    """Returns (last used, size, path) for every file in a cache directory, least recently used first."""
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((max(st.st_atime, st.st_mtime), st.st_size, entry.path))
+    except OSError:
+        return []
+    entries.sort()
+    return entries
+
+
+def prune_cache_dir(directory, limit):
+    """
+    Evicts the least recently used files in directory until it fits under limit bytes.
+    Returns the number of bytes still in use.
+    """
+    entries = cache_dir_entries(directory)
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in entries:
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError as e:
+            print(f"Failed to evict {path}: {e}")
+
+    return total
+
+
+def clear_cache_dir(directory):
+    """Deletes every file in a cache directory. Returns the number of bytes freed."""
+    freed = 0
+    for _, size, path in cache_dir_entries(directory):
+        try:
+            os.remove(path)
+            freed += size
+        except OSError as e:
+            print(f"Failed to delete {path}: {e}")
+    return freed
+
+
+def clear_image_cache():
+    """Deletes all cached thumbnails and banners. Returns the number of bytes freed."""
+    global _image_cache_usage
+    freed = clear_cache_dir(IMAGE_CACHE_DIR)
+    _image_cache_usage = None
+    return freed
+
+
+def _record_image_cache_write(size):
+    """Tracks image cache usage and evicts old entries once it grows past IMAGE_CACHE_LIMIT."""
+    global _image_cache_usage
+    with _image_cache_lock:
+        if _image_cache_usage is None:
+            _image_cache_usage = sum(size for _, size, _ in cache_dir_entries(IMAGE_CACHE_DIR))
+        else:
+            _image_cache_usage += size
+
+        if _image_cache_usage > IMAGE_CACHE_LIMIT:
+            # Evict down to 90% so the next few writes don't trigger another scan
+            _image_cache_usage = prune_cache_dir(IMAGE_CACHE_DIR, int(IMAGE_CACHE_LIMIT * 0.9))
+
+
+def image_cache_key(path, size, fade_factor=None):
+    """Hashes the source path, mtime, file size, target size and fade factor into a cache key."""
+    st = os.stat(path)
+    raw = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|{size[0]}x{size[1]}|{fade_factor}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def load_cached_image(path, size, fade_factor=None):
+    """
+    Returns a PIL image of path resized to size, with an optional alpha fade.
+    Resized images are stored in the image cache so repeat launches skip the LANCZOS resize.
+    Raises if the source image cannot be read.
+    """
+    key = image_cache_key(path, size, fade_factor)
+    ext = ".jpg" if fade_factor is None else ".png"
+    cache_path = os.path.join(IMAGE_CACHE_DIR, key + ext)
+
+    if os.path.exists(cache_path):
+        try:
+            image = Image.open(cache_path)
+            image.load()
+            touch_cache_entry(cache_path)
+            return image
+        except Exception:
+            pass  # Corrupt entry, rebuild it below
+
+    if fade_factor is None:
+        image = Image.open(path).convert("RGB").resize(size, Image.LANCZOS)
+    else:
+        image = Image.open(path).convert("RGBA").resize(size, Image.LANCZOS)
+        alpha = image.split()[3]
+        alpha = alpha.point(lambda p: int(p * fade_factor))
+        image.putalpha(alpha)
+
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"  # Scan workers may race the Tk thread
+        if fade_factor is None:
+            image.save(temp_path, format="JPEG", quality=90)
+        else:
+            image.save(temp_path, format="PNG")
+        os.replace(temp_path, cache_path)
+        _record_image_cache_write(os.path.getsize(cache_path))
+    except OSError as e:
+        print(f"Failed to cache image {path}: {e}")
+
+    return image
+
+
+def load_web_image(url, size):
+    """
+    Returns a PIL image of url resized to size. The resized image is kept in the image cache,
+    so a thumbnail is only downloaded once. Raises if it can't be downloaded or read.
+    """
+    key = hashlib.sha1(f"{url}|{size[0]}x{size[1]}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(IMAGE_CACHE_DIR, f"web-{key}.jpg")
+
+    if os.path.exists(cache_path):
+        try:
+            image = Image.open(cache_path)
+            image.load()
+            touch_cache_entry(cache_path)
+            return image
+        except Exception:
+            pass  # Corrupt entry, download it again
+
+    image = Image.open(io.BytesIO(http_get(url).content)).convert("RGB").resize(size, Image.LANCZOS)
+
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        image.save(temp_path, format="JPEG", quality=90)
+        os.replace(temp_path, cache_path)
+        _record_image_cache_write(os.path.getsize(cache_path))
+    except OSError as e:
+        print(f"Failed to cache image {url}: {e}")
+
+    return image
+
+
+# ────────────────
+# Patch Cache
+# ────────────────
+PATCH_CACHE_DIR = os.path.join(CACHE_DIR, "patched")
+PATCH_CACHE_LIMIT_MB = 4096  # Default, overridden by [Cache] patch_cache_mb in split.ini
+FICLONE = 0x40049409  # Linux ioctl for reflink copies on btrfs/XFS
+
+HASH_CACHE_PATH = os.path.join(CACHE_DIR, "hashes.json")
+HASH_CACHE_MAX_ENTRIES = 4096
+# Smaller files are cheaper to re-read than to track, and leaving them out stops thousands of
+# small mod assets from evicting the hashes of game files and patches
+HASH_CACHE_MIN_BYTES = 1024 * 1024
+
+_file_hashes = None
+_new_file_hashes = {}
+_file_hashes_lock = threading.Lock()
+
+
+def _hash_cache():
+    """Returns the persistent file hash cache, loading it from disk on first use."""
+    global _file_hashes
+    if _file_hashes is None:
+        _file_hashes = _read_hash_cache()
+    return _file_hashes
+
+
+def _read_hash_cache():
+    try:
+        with open(HASH_CACHE_PATH, "r", encoding="utf-8") as f:
+            hashes = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return hashes if isinstance(hashes, dict) else {}
+
+
+def flush_hash_cache():
+    """
+    Writes hashes computed since the last flush to disk, merged into whatever is there now so
+    other processes' entries survive. Keeps the HASH_CACHE_MAX_ENTRIES most recently used.
+    Called once at the end of each operation rather than per hash.
+    """
+    global _file_hashes
+    with _file_hashes_lock:
+        if not _new_file_hashes:
+            return
+        hashes = _read_hash_cache()
+        for key in _new_file_hashes:
+            hashes.pop(key, None)  # Re-insert so recently used entries sort last
+        hashes.update(_new_file_hashes)
+        _new_file_hashes.clear()
+        if len(hashes) > HASH_CACHE_MAX_ENTRIES:
+            hashes = dict(list(hashes.items())[-HASH_CACHE_MAX_ENTRIES:])
+        _file_hashes = hashes
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temp_path = f"{HASH_CACHE_PATH}.{os.getpid()}.tmp"  # Patch worker processes flush too
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(hashes, f)
+            os.replace(temp_path, HASH_CACHE_PATH)
+        except OSError as e:
+            print(f"Failed to save hash cache: {e}")
+
+
+def _stream_hash(path, size, chunk_size):
+    """Streams a file through SHA-256 from a read-only memory map, falling back to buffered reads."""
+    with open(path, "rb") as f:
+        if size:
+            try:
+                digest = hashlib.sha256()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        for offset in range(0, len(mm), chunk_size):
+                            digest.update(view[offset:offset + chunk_size])
+                    finally:
+                        view.release()
+                return digest.hexdigest()
+            except (OSError, ValueError):
+                f.seek(0)  # Not mappable (pipe, network share), read it instead
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """
+    Returns the SHA-256 hex digest of a file.
+    Digests of files of at least HASH_CACHE_MIN_BYTES are cached per (device, inode, mtime, size),
+    so unchanged game files, patches and backups are only ever read once, and a file keeps its hash
+    when renamed. New entries reach disk on the next flush_hash_cache().
+    """
+    st = os.stat(path)
+    if st.st_size < HASH_CACHE_MIN_BYTES:
+        return _stream_hash(path, st.st_size, chunk_size)
+
+    if st.st_ino:
+        key = f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+    else:
+        key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"  # No stable inode on this filesystem
+
+    with _file_hashes_lock:
+        cached = _hash_cache().get(key)
+        if cached:
+            _new_file_hashes[key] = cached  # Mark as recently used so it outlives cold entries
+            return cached
+
+    digest = _stream_hash(path, st.st_size, chunk_size)
+
+    with _file_hashes_lock:
+        _hash_cache()[key] = digest
+        _new_file_hashes[key] = digest
+    return digest
+
+
+def _reflink(src, dst):
+    """Creates dst as a copy-on-write clone of src. Raises OSError where unsupported."""
+    if platform.system() != "Linux":
+        raise OSError("reflinks are only supported on Linux")
+
+    import fcntl
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+
+
+def clone_file(src, dst, hardlink=False):
+    """
+    Copies src to dst as cheaply as the filesystem allows: reflink first, then a
+    hardlink if allowed, then a full copy. dst is replaced atomically.
+    Hardlinks share one inode, so only allow them when neither side is ever written in place.
+    Returns the method used ("reflink", "hardlink" or "copy").
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dst)), suffix=".tmp")
+    os.close(fd)
+    os.remove(temp_path)  # os.link needs a free name
+
+    try:
+        method = None
+        try:
+            _reflink(src, temp_path)
+            shutil.copymode(src, temp_path)
+            method = "reflink"
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        if not method and hardlink:
+            try:
+                os.link(src, temp_path)
+                method = "hardlink"
+            except OSError:
+                pass
+
+        if not method:
+            shutil.copy2(src, temp_path)
+            method = "copy"
+
+        os.replace(temp_path, dst)
+        return method
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def patch_cache_key(source_path, patch_path):
+    """Returns the cache key of a patch output: a hash of the source and patch file hashes."""
+    raw = f"{file_hash(source_path)}|{file_hash(patch_path)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def apply_patch_cached(source_path, patch_path, cache_limit_mb=PATCH_CACHE_LIMIT_MB, output_path=None,
+                       expected_sha256=None):
+    """
+    Applies an xdelta patch like apply_patch, but keeps the patched output in the patch cache.
+    When the same source and patch were applied before, the cached output is swapped in
+    by reflink or plain copy and xdelta is skipped entirely. Hardlinks are not used, since
+    anything writing to the game file in place would corrupt the cached copy.
+    With expected_sha256, cached and freshly decoded outputs are both verified against it.
+    Returns "cached" or "decoded" on success, None if the patch could not be applied.
+    """
+    output_path = output_path or source_path
+    key = patch_cache_key(source_path, patch_path)
+    cache_path = os.path.join(PATCH_CACHE_DIR, key)
+
+    if os.path.exists(cache_path):
+        try:
+            if expected_sha256 and file_hash(cache_path) != expected_sha256:
+                print(f"Cached output of {os.path.basename(patch_path)} failed verification, decoding again.")
+                os.remove(cache_path)
+            else:
+                clone_file(cache_path, output_path)
+                touch_cache_entry(cache_path)
+                return "cached"
+        except OSError as e:
+            print(f"Failed to use cached patch output: {e}")
+
+    if not apply_patch(source_path, patch_path, output_path, expected_sha256):
+        return None
+
+    try:
+        os.makedirs(PATCH_CACHE_DIR, exist_ok=True)
+        clone_file(output_path, cache_path)
+        prune_cache_dir(PATCH_CACHE_DIR, cache_limit_mb * 1024 * 1024)
+    except OSError as e:
+        print(f"Failed to cache patch output: {e}")
+
+    return "decoded"
+
+
+def apply_patch_chain(source_path, output_path, patch_paths, cache_limit_mb=PATCH_CACHE_LIMIT_MB, manifest=None):
+    """
+    Applies patch_paths to one target file in the given order. The first successful patch
+    reads source_path and writes output_path; later patches chain onto output_path.
+    If manifest (see load_mod_manifest) has an entry for a patch, its source hash is checked
+    before decoding and its output hash after, so a wrong game version is rejected up front.
+    Top-level so it can run in a worker process.
+    Returns one report per patch with "patch", "target", "result", "seconds", "size" (bytes of the
+    patched file) and "error".
+    """
+    manifest = manifest or {}
+    reports = []
+    current_source = source_path
+    for patch_path in patch_paths:
+        report = {
+            "patch": os.path.basename(patch_path),
+            "target": os.path.basename(output_path),
+            "result": None,
+            "seconds": 0.0,
+            "size": 0,
+            "error": None
+        }
+        expected = manifest.get(report["patch"], {})
+        start = time.perf_counter()
+        try:
+            if expected.get("source_sha256") and file_hash(current_source) != expected["source_sha256"]:
+                report["error"] = "game file is not the version this patch expects"
+            else:
+                report["result"] = apply_patch_cached(
+                    current_source, patch_path, cache_limit_mb, output_path, expected.get("output_sha256")
+                )
+                if report["result"]:
+                    report["size"] = os.path.getsize(output_path)
+                else:
+                    report["error"] = "xdelta decode failed"
+        except Exception as e:
+            report["error"] = str(e)
+        report["seconds"] = time.perf_counter() - start
+
+        if report["result"]:
+            current_source = output_path
+        reports.append(report)
+
+    flush_hash_cache()
+    return reports
+
+
+# ────────────────
+# Game File Backups
+# ────────────────
+SESSION_FILE = ".split_session.json"
+
+
+def load_session(game_dir):
+    """Returns the backup session recorded in game_dir, or None if no session is open."""
+    try:
+        with open(os.path.join(game_dir, SESSION_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_session(game_dir, session):
+    """Writes the backup session of game_dir atomically, or removes it when it has no backups left."""
+    path = os.path.join(game_dir, SESSION_FILE)
+    if not session.get("backups"):
+        if os.path.exists(path):
+            os.remove(path)
+        return
+
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(session, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def recover_game_files(game_dir, log=print):
+    """
+    Restores game files left patched by a session that never finished (crash, killed app).
+    Each pristine .bak is checked against the hash recorded before it was moved aside and
+    then renamed back into place, so recovery never copies data.
+    Backups that fail the check are left on disk untouched and stay in the session file, so
+    nothing can back up over them until the user resolves them. Returns the number of files restored.
+    """
+    session = load_session(game_dir)
+    if not session:
+        return 0
+
+    restored = 0
+    unresolved = []
+    for entry in session.get("backups", []):
+        original_path = os.path.join(game_dir, entry["file"])
+        backup_path = os.path.join(game_dir, entry["backup"])
+        if not os.path.exists(backup_path):
+            continue
+        try:
+            if file_hash(backup_path) != entry["sha256"]:
+                log(f"Backup {entry['backup']} does not match its recorded hash, leaving it in place.")
+                unresolved.append(entry)
+                continue
+            os.replace(backup_path, original_path)
+            restored += 1
+            log(f"Recovered {entry['file']} from an unfinished session.")
+        except OSError as e:
+            log(f"Failed to recover {entry['file']}: {e}")
+            unresolved.append(entry)
+
+    save_session(game_dir, {"backups": unresolved})
+    flush_hash_cache()
+    return restored
+
+
+# ────────────────
+# Mod Manifest
+# ────────────────
+MOD_MANIFEST = "manifest.ini"
+
+
+def find_patch_targets(game_dir):
+    """Returns the names of the game files patches can target (.exe and .win files)."""
+    return [
+        f for f in os.listdir(game_dir)
+        if f.lower().endswith((".exe", ".win")) and os.path.isfile(os.path.join(game_dir, f))
+    ]
+
+
+def match_patch_target(xdelta_file, input_candidates):
+    """Returns the game file a patch targets, judged by its name (data.win.xdelta → data.win), or None."""
+    return next((f for f in input_candidates if f.lower() in xdelta_file.lower()), None)
+
+
+def load_mod_manifest(mod_path):
+    """
+    Reads the mod's manifest.ini, which sits next to mod.ini and records, for each patch,
+    the file it targets and the SHA-256 of that file before and after patching:
+
+        [data.win.xdelta]
+        target = data.win
+        source_sha256 = ...
+        output_sha256 = ...
+
+    Returns {patch file name: {"target", "source_sha256", "output_sha256"}}, empty without a manifest.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    config.read(os.path.join(mod_path, MOD_MANIFEST))
+    return {
+        section: {
+            "target": config.get(section, "target", fallback=""),
+            "source_sha256": config.get(section, "source_sha256", fallback=""),
+            "output_sha256": config.get(section, "output_sha256", fallback="")
+        }
+        for section in config.sections()
+    }
+
+
+def write_mod_manifest(mod_path, manifest):
+    """Writes manifest entries (as returned by load_mod_manifest) to the mod's manifest.ini."""
+    config = configparser.ConfigParser()
+    config.optionxform = str
+    for patch_name, entry in manifest.items():
+        config[patch_name] = entry
+    with open(os.path.join(mod_path, MOD_MANIFEST), "w", encoding="utf-8") as f:
+        config.write(f)
+
+
+def build_mod_manifest(mod_path, game_dir, log=print):
+    """
+    Creates manifest.ini for a mod by applying its patches once to the unmodified game files
+    in a scratch directory and hashing the inputs and outputs. Patches for the same file are
+    chained in name order, like the patcher does.
+    Returns the manifest entries.
+    """
+    session = load_session(game_dir) or {}
+    backups = {entry["file"]: entry["backup"] for entry in session.get("backups", [])}
+    input_candidates = find_patch_targets(game_dir)
+    manifest = {}
+    outputs = {}
+
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        for xdelta_file in sorted(f for f in os.listdir(mod_path) if f.endswith(".xdelta")):
+            target = match_patch_target(xdelta_file, input_candidates)
+            if not target:
+                log(f"No matching input for patch: {xdelta_file}")
+                continue
+
+            # While a session is open the pristine file is the .bak
+            source_path = outputs.get(target, os.path.join(game_dir, backups.get(target, target)))
+            output_path = os.path.join(scratch_dir, f"{len(manifest)}.out")
+            if not apply_patch(source_path, os.path.join(mod_path, xdelta_file), output_path):
+                log(f"Patch invalid: {xdelta_file} for {target}")
+                continue
+
+            manifest[xdelta_file] = {
+                "target": target,
+                "source_sha256": file_hash(source_path),
+                "output_sha256": file_hash(output_path)
+            }
+            outputs[target] = output_path
+            log(f"Recorded {xdelta_file} → {target}")
+
+    write_mod_manifest(mod_path, manifest)
+    flush_hash_cache()
+    return manifest
+
+
+def verify_mod_manifest(mod_path, game_dir):
+    """
+    Checks the game files against the source hashes in the mod's manifest without decoding anything.
+    Patches that chain onto an earlier patch of the same file are checked only for presence.
+    Returns a list of (patch name, ok, message); empty if the mod has no manifest.
+    """
+    session = load_session(game_dir) or {}
+    backups = {entry["file"]: entry["backup"] for entry in session.get("backups", [])}
+    results = []
+    seen_targets = set()
+
+    for patch_name, entry in sorted(load_mod_manifest(mod_path).items()):
+        target = entry["target"]
+        if not os.path.exists(os.path.join(mod_path, patch_name)):
+            results.append((patch_name, False, "patch file is missing"))
+            continue
+        if target in seen_targets:
+            results.append((patch_name, True, f"chained onto an earlier {target} patch"))
+            continue
+        seen_targets.add(target)
+
+        # While a session is open the pristine file is the .bak
+        target_path = os.path.join(game_dir, backups.get(target, target))
+        if not os.path.exists(target_path):
+            results.append((patch_name, False, f"{target} not found in game directory"))
+        elif file_hash(target_path) != entry["source_sha256"]:
+            results.append((patch_name, False, f"{target} is not the version this patch expects"))
+        else:
+            results.append((patch_name, True, f"{target} matches"))
+
+    flush_hash_cache()
+    return results
+
+
+# ────────────────
+# Mod Asset Staging
+# ────────────────
+ASSET_FOLDERS = ("lang", "sound")
+STAGING_MANIFEST = ".split_staging.json"
+ORIGINAL_SUFFIX = ".split-orig"
+
+
+def link_file(src, dst):
+    """
+    Makes dst point at src without copying data where possible.
+    Tries a symlink, then a reflink or hardlink, then falls back to a full copy.
+    Returns the method used.
+    """
+    try:
+        os.symlink(src, dst)
+        return "symlink"
+    except (OSError, NotImplementedError):
+        pass  # Windows needs developer mode for symlinks
+    return clone_file(src, dst, hardlink=True)
+
+
+def stage_folder(source_folder, target_folder):
+    """
+    Recreates source_folder's directory tree under target_folder and links every file into it.
+    Returns a dictionary counting how many files were staged with each method.
+    """
+    methods = {}
+    source_folder = os.path.abspath(source_folder)
+
+    for root, _, files in os.walk(source_folder):
+        target_root = os.path.join(target_folder, os.path.relpath(root, source_folder))
+        os.makedirs(target_root, exist_ok=True)
+        for file in files:
+            method = link_file(os.path.join(root, file), os.path.join(target_root, file))
+            methods[method] = methods.get(method, 0) + 1
+
+    return methods
+
+
+def load_staging_manifest(game_dir):
+    """Returns the staging manifest of game_dir, or None if no mod assets are staged."""
+    try:
+        with open(os.path.join(game_dir, STAGING_MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_staging_manifest(game_dir, manifest):
+    """Writes the staging manifest of game_dir atomically."""
+    path = os.path.join(game_dir, STAGING_MANIFEST)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def unstage_mod_assets(game_dir):
+    """
+    Removes staged mod asset folders and moves the game's original folders back.
+    Only links are removed, so this costs almost nothing regardless of folder size.
+    Returns True if anything was unstaged.
+    """
+    manifest = load_staging_manifest(game_dir)
+    if not manifest:
+        return False
+
+    for entry in manifest.get("folders", []):
+        target_folder = os.path.join(game_dir, entry["folder"])
+        original_folder = target_folder + ORIGINAL_SUFFIX
+
+        if os.path.islink(target_folder):
+            os.unlink(target_folder)
+        elif os.path.isdir(target_folder):
+            shutil.rmtree(target_folder)
+
+        if entry.get("replaced") and os.path.isdir(original_folder):
+            os.rename(original_folder, target_folder)
+        print(f"Unstaged {entry['folder']}/ from game directory.")
+
+    os.remove(os.path.join(game_dir, STAGING_MANIFEST))
+    return True
+
+
+def stage_mod_assets(mod_path, game_dir, folders=ASSET_FOLDERS):
+    """
+    Activates a mod's asset folders (lang/, sound/) by linking instead of copying.
+    The game's own folders are renamed aside and everything replaced is recorded in a
+    manifest in game_dir, so unstage_mod_assets can undo it. Any previously staged mod
+    is unstaged first, so switching mods never rewrites the asset data.
+    Returns the manifest.
+    """
+    unstage_mod_assets(game_dir)
+
+    manifest = {"mod_path": mod_path, "folders": []}
+    for folder_name in folders:
+        source_folder = os.path.join(mod_path, folder_name)
+        target_folder = os.path.join(game_dir, folder_name)
+
+        if not os.path.isdir(source_folder):
+            print(f"No {folder_name}/ folder in mod.")
+            continue
+
+        replaced = os.path.lexists(target_folder)
+        if replaced:
+            os.rename(target_folder, target_folder + ORIGINAL_SUFFIX)
+
+        entry = {"folder": folder_name, "replaced": replaced, "methods": {}}
+        manifest["folders"].append(entry)
+        save_staging_manifest(game_dir, manifest)  # Recorded before staging so a crash can be undone
+
+        entry["methods"] = stage_folder(source_folder, target_folder)
+        print(f"Staged {folder_name}/ in game directory: {entry['methods']}")
+
+    save_staging_manifest(game_dir, manifest)
+    return manifest
+
+
+# ────────────────
+# Incremental Asset Sync
+# ────────────────
+SYNC_WORKERS = 8
+MTIME_TOLERANCE = 1  # seconds, FAT and network drives round timestamps
+
+
+def files_differ(source_path, target_path, use_hash=False):
+    """Returns True if target_path is missing or differs from source_path by size, mtime or hash."""
+    try:
+        target_st = os.stat(target_path)
+    except OSError:
+        return True
+
+    source_st = os.stat(source_path)
+    if source_st.st_size != target_st.st_size:
+        return True
+    if use_hash:
+        return file_hash(source_path) != file_hash(target_path)
+    return abs(source_st.st_mtime - target_st.st_mtime) > MTIME_TOLERANCE
+
+
+def sync_folder(source_folder, target_folder, use_hash=False, workers=SYNC_WORKERS):
+    """
+    Makes target_folder an exact copy of source_folder without rewriting unchanged files.
+    Only files whose size, mtime or (optionally) hash differ are copied, in parallel,
+    and only files the source does not have are deleted.
+    Returns a dictionary with "copied", "deleted", "unchanged", "bytes" and "errors".
+    """
+    stats = {"copied": 0, "deleted": 0, "unchanged": 0, "bytes": 0, "errors": []}
+    source_files = set()
+    source_dirs = {"."}
+    to_copy = []
+
+    for root, dirs, files in os.walk(source_folder):
+        rel_root = os.path.relpath(root, source_folder)
+        os.makedirs(os.path.join(target_folder, rel_root), exist_ok=True)
+        source_dirs.update(os.path.normpath(os.path.join(rel_root, d)) for d in dirs)
+
+        for file in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            source_files.add(rel_path)
+            if files_differ(os.path.join(source_folder, rel_path), os.path.join(target_folder, rel_path), use_hash):
+                to_copy.append(rel_path)
+            else:
+                stats["unchanged"] += 1
+
+    # Delete files and folders the mod doesn't have
+    for root, dirs, files in os.walk(target_folder, topdown=False):
+        rel_root = os.path.relpath(root, target_folder)
+        for file in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, file))
+            if rel_path not in source_files:
+                try:
+                    os.remove(os.path.join(target_folder, rel_path))
+                    stats["deleted"] += 1
+                except OSError as e:
+                    stats["errors"].append(f"{rel_path}: {e}")
+        for d in dirs:
+            rel_path = os.path.normpath(os.path.join(rel_root, d))
+            if rel_path not in source_dirs:
+                try:
+                    os.rmdir(os.path.join(target_folder, rel_path))
+                except OSError as e:
+                    stats["errors"].append(f"{rel_path}: {e}")
+
+    def copy_one(rel_path):
+        target_path = os.path.join(target_folder, rel_path)
+        if os.path.lexists(target_path):
+            os.remove(target_path)  # Never write through a link into the mod folder
+        shutil.copy2(os.path.join(source_folder, rel_path), target_path)
+        return os.path.getsize(target_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(copy_one, rel_path): rel_path for rel_path in to_copy}
+        for future in as_completed(futures):
+            try:
+                stats["bytes"] += future.result()
+                stats["copied"] += 1
+            except OSError as e:
+                stats["errors"].append(f"{futures[future]}: {e}")
+
+    flush_hash_cache()
+    return stats
+
+
+# ────────────────
+# Translation File Cleanup
+# ────────────────
+PO_INDEX = ".split_po_index.json"
+
+
+def find_po_files(folder):
+    """Returns the paths of all .po files under folder, relative to folder."""
+    paths = []
+    for root, _, files in os.walk(folder):
+        for file in files:
+            if file.endswith(".po"):
+                paths.append(os.path.relpath(os.path.join(root, file), folder))
+    return paths
+
+
+def load_po_index(game_dir):
+    """Returns the indexed .po paths of game_dir, or None if no index has been built yet."""
+    try:
+        with open(os.path.join(game_dir, PO_INDEX), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_po_index(game_dir, paths):
+    """Writes the .po index of game_dir atomically."""
+    path = os.path.join(game_dir, PO_INDEX)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(sorted(set(paths)), f)
+    os.replace(path + ".tmp", path)
+
+
+def record_po_files(game_dir, paths):
+    """
+    Adds .po files introduced into game_dir (paths relative to game_dir) to its index.
+    Does nothing before the first full build, which will find them anyway.
+    """
+    index = load_po_index(game_dir)
+    if index is None or not paths:
+        return
+    save_po_index(game_dir, index + list(paths))
+
+
+def clean_po_files(game_dir, dry_run=False, rebuild=False):
+    """
+    Deletes leftover .po translation files from the game directory.
+    The game is walked once to build an index; after that only indexed files are
+    touched, so cleanup costs O(files to delete) rather than O(files in the game).
+    Pass rebuild=True to re-walk the game after files were added outside the patcher.
+    With dry_run, nothing is deleted and the files that would be deleted are returned.
+    Returns the list of deleted (or to-be-deleted) paths, relative to game_dir.
+    """
+    index = None if rebuild else load_po_index(game_dir)
+    if index is None:
+        index = find_po_files(game_dir)
+        if not dry_run:
+            save_po_index(game_dir, index)
+
+    existing = [rel_path for rel_path in index if os.path.lexists(os.path.join(game_dir, rel_path))]
+    if dry_run:
+        return existing
+
+    deleted = []
+    remaining = []
+    for rel_path in existing:
+        try:
+            os.remove(os.path.join(game_dir, rel_path))
+            deleted.append(rel_path)
+        except OSError as e:
+            print(f"Failed to delete {rel_path}: {e}")
+            remaining.append(rel_path)
+
+    save_po_index(game_dir, remaining)
+    return deleted
+
+
+# ────────────────
+# Batch Conversion
+# ────────────────
+CONVERT_WORKERS = 4
+# A 5-7 digit GameBanana ID standing on its own in a folder name, e.g. "Cool Mod [412345]" or "412345"
+FOLDER_ID_PATTERN = re.compile(r"(?:^|[\s_\-\[(#])(\d{5,7})(?=[\s\])]|$)")
+LINK_ID_PATTERN = re.compile(r"gamebanana\.com/mods/(\d+)")
+
+
+def detect_mod_id(mod_dir):
+    """Guesses a folder's GameBanana ID from the link in its mod.ini, then from its folder name. Returns None if neither has one."""
+    ini_path = find_mod_ini(mod_dir)
+    if ini_path:
+        # Raw read: files written by older versions can hold a bare % that interpolation rejects
+        config = configparser.RawConfigParser()
+        config.optionxform = str
+        config.read(ini_path, encoding="utf-8")
+        match = LINK_ID_PATTERN.search(config.get("Mod", "link", fallback=""))
+        if match:
+            return match.group(1)
+    match = FOLDER_ID_PATTERN.search(os.path.basename(os.path.normpath(mod_dir)))
+    return match.group(1) if match else None
+
+
+def read_conversion_csv(csv_path, mods_path=None):
+    """
+    Reads folder,mod_id rows (a header row is optional). Folders may be absolute or relative to mods/.
+    Returns a list of (mod_dir, mod_id).
+    """
+    mods_path = mods_path or MODS_PATH
+    jobs = []
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:  # Spreadsheet exports often start with a BOM
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[1].strip().isdigit():
+                continue  # Header, blank or malformed row
+            folder = row[0].strip()
+            jobs.append((folder if os.path.isabs(folder) else os.path.join(mods_path, folder), row[1].strip()))
+    return jobs
+
+
+def find_conversion_jobs(mods_path=None, csv_path=None):
+    """
+    Lists the mod folders to convert, from a CSV mapping or by detecting IDs in mods/.
+    Returns (jobs, skipped): [(mod_dir, mod_id)] and [(mod_dir, reason)] for folders that can't be converted.
+    """
+    if csv_path:
+        return read_conversion_csv(csv_path, mods_path), []
+
+    mods_path = mods_path or MODS_PATH
+    jobs, skipped = [], []
+    if not os.path.isdir(mods_path):
+        return jobs, skipped
+    for entry in sorted(os.scandir(mods_path), key=lambda e: e.name.lower()):
+        if not entry.is_dir():
+            continue
+        try:
+            mod_id = detect_mod_id(entry.path)
+        except Exception as e:
+            skipped.append((entry.path, f"unreadable mod.ini: {e}"))
+            continue
+        if mod_id:
+            jobs.append((entry.path, mod_id))
+        else:
+            skipped.append((entry.path, "no GameBanana ID found"))
+    return jobs, skipped
+
+
+def convert_mod(mod_dir, mod_id):
+    """
+    Fetches one mod's profile (through the profile cache) and writes its mod.ini, downloading thumbnail.jpg if the folder has none.
+    Returns {"mod_dir", "mod_id", "name", "thumbnail", "error", "seconds"}; never raises.
+    """
+    start = time.perf_counter()
+    result = {"mod_dir": mod_dir, "mod_id": mod_id, "name": "", "thumbnail": None, "error": None}
+    try:
+        if not os.path.isdir(mod_dir):
+            raise FileNotFoundError(f"folder not found: {mod_dir}")
+        mod_info = fetch_profile_info(mod_id)
+        write_mod_ini(mod_dir, mod_info)
+        result["name"] = mod_info["name"]
+
+        thumbnail_path = os.path.join(mod_dir, "thumbnail.jpg")
+        if os.path.exists(thumbnail_path):
+            result["thumbnail"] = "kept"
+        else:
+            thumb_url = mod_info.get("thumbnail_url") or resolve_thumbnail_url(mod_id, log=lambda message: None)
+            if thumb_url:
+                http_download(thumb_url, thumbnail_path)
+                result["thumbnail"] = "downloaded"
+            else:
+                result["thumbnail"] = "missing"
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def convert_mods(jobs, workers=CONVERT_WORKERS, on_result=None):
+    """
+    Converts many mods at once on a bounded thread pool. The shared HTTP client's per-host limit
+    keeps this polite to GameBanana. Calls on_result(result) as each one finishes and returns them in job order.
+    """
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(convert_mod, mod_dir, mod_id): i for i, (mod_dir, mod_id) in enumerate(jobs)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    return results
+
+
+def conversion_report(results, skipped=()):
+    """Summarises a batch conversion as text: one line per mod, then totals."""
+    lines = []
+    for result in results:
+        folder = os.path.basename(os.path.normpath(result["mod_dir"]))
+        if result["error"]:
+            lines.append(f"FAIL {folder} ({result['mod_id']}): {result['error']}")
+        else:
+            lines.append(f"OK   {folder} ({result['mod_id']}): {result['name']}, thumbnail {result['thumbnail']}")
+    for mod_dir, reason in skipped:
+        lines.append(f"SKIP {os.path.basename(os.path.normpath(mod_dir))}: {reason}")
+
+    failed = sum(1 for result in results if result["error"])
+    lines.append(f"{len(results) - failed} converted, {failed} failed, {len(skipped)} skipped.")
+    return "\n".join(lines)
+
+
+# ────────────────
+# Profile Cache
+# ────────────────
+PROFILE_CACHE_PATH = os.path.join(CACHE_DIR, "profiles.sqlite")
+PROFILE_TTL_HOURS = 24  # Default, overridden by [Cache] profile_ttl_hours in split.ini
+STATS_MAX_AGE_MINUTES = 60  # Refreshing stats again within this window is served from the cache
+
+
+def _profile_db():
+    """Opens the profile cache, creating it on first use. One connection per call keeps it safe across threads."""
+    os.makedirs(os.path.dirname(PROFILE_CACHE_PATH), exist_ok=True)
+    db = sqlite3.connect(PROFILE_CACHE_PATH, timeout=10)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("CREATE TABLE IF NOT EXISTS profiles (mod_id INTEGER PRIMARY KEY, fetched REAL NOT NULL, data TEXT NOT NULL)")
+    return db
+
+
+def profile_ttl_seconds():
+    return load_split_config().getfloat("Cache", "profile_ttl_hours", fallback=PROFILE_TTL_HOURS) * 3600
+
+
+def get_cached_profile(mod_id, max_age):
+    """Returns the cached mod info for mod_id if it was fetched less than max_age seconds ago, else None."""
+    try:
+        db = _profile_db()
+        try:
+            row = db.execute("SELECT fetched, data FROM profiles WHERE mod_id = ?", (int(mod_id),)).fetchone()
+        finally:
+            db.close()
+    except sqlite3.Error as e:
+        print(f"Profile cache unavailable: {e}")
+        return None
+    if row and time.time() - row[0] < max_age:
+        return json.loads(row[1])
+    return None
+
+
+def store_profile(mod_id, info):
+    try:
+        db = _profile_db()
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO profiles (mod_id, fetched, data) VALUES (?, ?, ?)",
+                    (int(mod_id), time.time(), json.dumps(info))
+                )
+        finally:
+            db.close()
+    except sqlite3.Error as e:
+        print(f"Failed to cache profile {mod_id}: {e}")
+
+
+def fetch_profile_info(mod_id, max_age=None):
+    """
+    Returns mod.ini fields plus "thumbnail_url" for a GameBanana mod. Served from the profile cache
+    while it's younger than max_age seconds (default: profile_ttl_hours), otherwise fetched and cached.
+    """
+    max_age = profile_ttl_seconds() if max_age is None else max_age
+    info = get_cached_profile(mod_id, max_age)
+    if info is not None:
+        return info
+
+    mod = get_api().get_mod_profile(int(mod_id))
+    info = profile_to_mod_info(mod_id, mod)
+    info["thumbnail_url"] = profile_thumbnail_url(mod) or ""
+    store_profile(mod_id, info)
+    return info
+
+
+def find_stats_jobs(mods_path=None):
+    """Returns [(mod_dir, mod_id)] for the mods whose stats can be refreshed: a GameBanana ID and a mod.ini."""
+    jobs, _ = find_conversion_jobs(mods_path)
+    return [(mod_dir, mod_id) for mod_dir, mod_id in jobs if find_mod_ini(mod_dir)]
+
+
+def refresh_mod_stats(jobs, workers=None, max_age=None, on_result=None):
+    """
+    Updates like_count and download_count in the mod.ini of each (mod_dir, mod_id) job, on a bounded pool.
+    Files are only rewritten when a count changed. Calls on_result(result) per mod and returns the results:
+    {"mod_dir", "mod_id", "name", "status" ("updated", "unchanged" or "failed"), "error"}.
+    """
+    max_age = STATS_MAX_AGE_MINUTES * 60 if max_age is None else max_age
+
+    def refresh(mod_dir, mod_id):
+        result = {"mod_dir": mod_dir, "mod_id": mod_id, "name": "", "status": "failed", "error": None}
+        try:
+            info = fetch_profile_info(mod_id, max_age)
+            ini_path = find_mod_ini(mod_dir)
+            # Raw read, like write_mod_ini: older mod.ini files may hold a bare % elsewhere
+            current = configparser.RawConfigParser()
+            current.optionxform = str
+            current.read(ini_path, encoding="utf-8")
+            result["name"] = current.get("Mod", "name", fallback="")
+            counts = (current.get("Mod", "like_count", fallback=""), current.get("Mod", "download_count", fallback=""))
+            if counts == (info["like_count"], info["download_count"]):
+                result["status"] = "unchanged"
+            else:
+                write_mod_ini(os.path.dirname(ini_path), info, fields=("like_count", "download_count"))
+                result["status"] = "updated"
+        except Exception as e:
+            result["error"] = str(e)
+        return result
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, workers or CONVERT_WORKERS)) as executor:
+        for future in as_completed([executor.submit(refresh, mod_dir, mod_id) for mod_dir, mod_id in jobs]):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result)
+    return results
+
+
+def stats_report(results):
+    counts = {status: sum(1 for result in results if result["status"] == status) for status in ("updated", "unchanged", "failed")}
+    lines = [
+        f"FAIL {os.path.basename(os.path.normpath(result['mod_dir']))} ({result['mod_id']}): {result['error']}"
+        for result in results if result["error"]
+    ]
+    lines.append(f"{counts['updated']} updated, {counts['unchanged']} unchanged, {counts['failed']} failed.")
+    return "\n".join(lines)
+
+
+# ────────────────
+# Mod Browser Data
+# ────────────────
+BROWSER_QUERY = "pizza tower"  # Default, overridden by [Browser] query in split.ini
+THUMBNAIL_FETCH_WORKERS = 4
+
+
+def search_record_to_mod(record):
+    """Maps an apiv11 search record onto the fields the browser shows."""
+    submitter = record.get("_aSubmitter") or {}
+    images = (record.get("_aPreviewMedia") or {}).get("_aImages") or []
+    thumbnail_url = ""
+    for image in images:
+        # Prefer the 530px rendition; it's plenty for a card and a fraction of the full size
+        if image.get("_sBaseUrl") and (image.get("_sFile530") or image.get("_sFile")):
+            thumbnail_url = f"{image['_sBaseUrl'].rstrip('/')}/{image.get('_sFile530') or image['_sFile']}"
+            break
+
+    posted = ""
+    if record.get("_tsDateAdded"):
+        posted = time.strftime("%Y-%m-%d", time.localtime(record["_tsDateAdded"]))
+
+    return {
+        "id": record.get("_idRow"),
+        "name": record.get("_sName") or "",
+        "url": record.get("_sProfileUrl") or "",
+        "creator": submitter.get("_sName") or "Unknown",
+        "posted": posted,
+        "thumbnail_url": thumbnail_url
+    }
+
+
+def search_mods(query, page, per_page):
+    """
+    Fetches one page (1-based) of GameBanana mod search results through the shared HTTP client.
+    Returns (mods, total), where total is the result count or None if the API didn't say.
+    """
+    response = http_get(gamebanana_url("/apiv11/Util/Search/Results"), params={
+        "_sSearchString": query,
+        "_sModelName": "Mod",
+        "_sOrder": "best_match",
+        "_nPage": page,
+        "_nPerpage": per_page
+    })
+    data = response.json()
+    mods = [search_record_to_mod(record) for record in data.get("_aRecords") or []]
+    total = (data.get("_aMetadata") or {}).get("_nRecordCount")
+    return mods, total
+
+
+class ModSearch:
+    """
+    Pages of search results fetched on worker threads as they're asked for, with the following page
+    prefetched. Queued fetches for pages the user has moved away from are cancelled. Pages arrive
+    through poll(), which must be called from the Tk thread.
+    """
+
+    def __init__(self, query, per_page, workers=2):
+        self.query = query
+        self.per_page = per_page
+        self.pages = {}
+        self.total = None
+        self.futures = {}
+        self.events = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def page_count(self):
+        """Returns the number of pages, or None while the total is unknown."""
+        if self.total is None:
+            return None
+        return max(1, -(-self.total // self.per_page))
+
+    def has_page(self, page):
+        count = self.page_count()
+        if count is not None:
+            return page < count
+        # Total unknown: assume more results as long as the last known page was full
+        previous = self.pages.get(page - 1)
+        return page == 0 or previous is None or len(previous) == self.per_page
+
+    def request(self, page):
+        """Returns the mods on page (0-based) if loaded, otherwise starts fetching it and returns None."""
+        wanted = {page, page + 1}
+        for other, future in list(self.futures.items()):
+            if other not in wanted and future.cancel():
+                del self.futures[other]
+
+        for wanted_page in sorted(wanted):
+            if wanted_page not in self.pages and wanted_page not in self.futures and self.has_page(wanted_page):
+                self.futures[wanted_page] = self.executor.submit(self._fetch, wanted_page)
+        return self.pages.get(page)
+
+    def _fetch(self, page):
+        try:
+            mods, total = search_mods(self.query, page + 1, self.per_page)
+            self.events.put(("page", page, (mods, total)))
+        except Exception as e:
+            self.events.put(("error", page, str(e)))
+
+    def poll(self):
+        """Stores finished pages and returns [(kind, page, error)] for everything that finished since the last call."""
+        finished = []
+        while True:
+            try:
+                kind, page, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.futures.pop(page, None)
+            if kind == "page":
+                mods, total = payload
+                self.pages[page] = mods
+                if total is not None:
+                    self.total = total
+                finished.append((kind, page, None))
+            else:
+                finished.append((kind, page, payload))
+        return finished
+
+
+class ThumbnailFetcher:
+    """
+    Downloads and resizes thumbnails on a few worker threads, lowest priority number first, so the
+    cards on screen load before prefetched ones. Every request carries a generation; starting a new
+    generation (when the user changes page) drops everything still queued for the old one.
+    Results come back as PIL images through poll() so PhotoImages are only built on the Tk thread.
+    """
+
+    def __init__(self, size, workers=THUMBNAIL_FETCH_WORKERS):
+        self.size = size
+        self.generation = 0
+        self.requests = queue.PriorityQueue()
+        self.results = queue.Queue()
+        self.sequence = 0
+        self.requested = set()
+        self.lock = threading.Lock()
+        for _ in range(workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def new_generation(self):
+        with self.lock:
+            self.generation += 1
+            self.requested.clear()
+            return self.generation
+
+    def request(self, url, priority=0):
+        """Queues url for the current generation unless it's already queued."""
+        with self.lock:
+            if url in self.requested:
+                return
+            self.requested.add(url)
+            self.sequence += 1
+            self.requests.put((priority, self.sequence, self.generation, url))
+
+    def _work(self):
+        while True:
+            _, _, generation, url = self.requests.get()
+            if generation != self.generation:
+                continue  # Cancelled: the user has left the page that wanted it
+            try:
+                image = load_web_image(url, self.size)
+            except Exception as e:
+                print(f"Failed to load thumbnail {url}: {e}")
+                image = None
+            self.results.put((url, image))
+
+    def poll(self):
+        """Returns [(url, PIL image or None)] for thumbnails finished since the last call."""
+        finished = []
+        while True:
+            try:
+                finished.append(self.results.get_nowait())
+            except queue.Empty:
+                return finished
+
+
+# ────────────────
+# Patch Pipeline
+# ────────────────
+class PatchPipeline:
+    """
+    Patches the game with one mod, launches it and restores the game files when it exits.
+    The pipeline never touches Tk: log lines, stage progress and error dialogs are
+    reported through callbacks, so it can run on a worker thread or headless.
+    """
+
+    STAGES = (
+        "Finding patches",
+        "Applying patches",
+        "Staging mod assets",
+        "Copying DLLs",
+        "Cleaning .po files",
+        "Game running",
+        "Restoring game files"
+    )
+
+    def __init__(self, mod_path, game_dir, config=None, on_log=None, on_progress=None, on_message=None):
+        self.mod_path = mod_path
+        self.game_dir = game_dir
+        self.on_log = on_log or print
+        self.on_progress = on_progress or (lambda step, label: None)
+        self.on_message = on_message or (lambda kind, title, message: print(f"{title}: {message}"))
+
+        config = config or load_split_config()
+        self.cache_limit_mb = config.getint("Cache", "patch_cache_mb", fallback=PATCH_CACHE_LIMIT_MB)
+        self.asset_mode = config.get("Patching", "asset_mode", fallback="link")
+        self.sync_hash = config.getboolean("Patching", "sync_hash", fallback=False)
+
+        self.xdelta_files = []
+        self.input_candidates = []
+        self.main_exe = None
+        self.session = {"backups": []}
+        self.backups = {}
+        self.patch_report = []
+        self.proc = None
+
+    def stage(self, name):
+        """Reports that the stage called name has started."""
+        self.on_progress(self.STAGES.index(name) + 1, name)
+
+    def prepare(self):
+        """
+        Finds the mod's patch files, the game files they target and the main exe.
+        Returns False if there is nothing to patch or launch.
+        """
+        self.stage("Finding patches")
+        recover_game_files(self.game_dir, self.on_log)
+
+        unresolved = (load_session(self.game_dir) or {}).get("backups", [])
+        if unresolved:
+            names = ", ".join(entry["backup"] for entry in unresolved)
+            self.on_log(f"Unresolved backups from an earlier session: {names}")
+            self.on_message(
+                "error",
+                "Unresolved Backup",
+                f"These backups could not be verified and were left in place:\n\n{names}\n\n"
+                f"Check them, restore or delete them by hand, then delete {SESSION_FILE} in the game folder."
+            )
+            return False
+
+        self.xdelta_files = [f for f in os.listdir(self.mod_path) if f.endswith(".xdelta")]
+        self.input_candidates = find_patch_targets(self.game_dir)
+
+        if not self.xdelta_files or not self.input_candidates:
+            self.on_log("No patches or no valid input files found.")
+            return False
+
+        exe_candidates = [
+            f for f in os.listdir(self.game_dir)
+            if f.lower().endswith(".exe") and "unins" not in f.lower() and "setup" not in f.lower()
+        ]
+
+        for f in exe_candidates:
+            if any(f.lower() in x.lower() for x in self.xdelta_files):
+                self.main_exe = os.path.join(self.game_dir, f)
+                break
+        if not self.main_exe and exe_candidates:
+            self.main_exe = os.path.join(self.game_dir, exe_candidates[0])
+
+        if not self.main_exe:
+            self.on_message("warning", "Game Not Launched", "No .exe file found in game directory.")
+            return False
+
+        return True
+
+    def backup(self, file_path):
+        """
+        Moves file_path aside as a pristine .bak by rename, so no data is copied.
+        The backup and its hash are recorded in the session file first, so a crash
+        mid-session can be recovered by recover_game_files.
+        Returns True if file_path is backed up.
+        """
+        if file_path in self.backups:
+            return True
+
+        file_name = os.path.basename(file_path)
+        backup_path = file_path + ".bak"
+        if os.path.exists(backup_path):
+            # May be the only pristine copy (an unverified backup or one left by an older version)
+            self.on_log(f"{file_name}.bak already exists, refusing to overwrite it.")
+            self.on_message(
+                "error",
+                "Backup Failed",
+                f"{backup_path} already exists and may be the only unmodified copy of {file_name}.\n\n"
+                "Restore or remove it by hand before patching."
+            )
+            return False
+
+        entry = {"file": file_name, "backup": file_name + ".bak"}
+        try:
+            entry["sha256"] = file_hash(file_path)
+            self.session["backups"].append(entry)
+            save_session(self.game_dir, self.session)
+            if os.path.exists(backup_path):
+                raise FileExistsError(f"{backup_path} appeared while backing up")
+            os.rename(file_path, backup_path)
+            self.backups[file_path] = backup_path
+            self.on_log(f"Backed up {file_name} to {backup_path}")
+            return True
+        except Exception as e:
+            if entry in self.session["backups"]:
+                self.session["backups"].remove(entry)
+            self.on_log(f"Failed to back up {file_name}: {e}")
+            self.on_message("error", "Backup Failed", f"Could not back up {file_name}:\n\n{e}")
+            return False
+
+    def restore_file(self, file_path):
+        """Renames the pristine backup of file_path back into place and drops it from the session."""
+        backup_path = self.backups.pop(file_path)
+        try:
+            os.replace(backup_path, file_path)
+            self.on_log(f"Restored {backup_path} → {file_path}")
+        except Exception as e:
+            self.on_log(f"Failed to restore {backup_path}: {e}")
+            self.on_message("error", "Restore Failed", f"Could not restore file:\n\n{backup_path}\n\nError: {e}")
+            return
+
+        file_name = os.path.basename(file_path)
+        self.session["backups"] = [entry for entry in self.session["backups"] if entry["file"] != file_name]
+        save_session(self.game_dir, self.session)
+
+    def apply_patches(self):
+        """
+        Applies every .xdelta in the mod to the game file it targets.
+        Patches are grouped by target: groups run in parallel worker processes, and
+        patches within a group are chained in name order. Hashes in the mod's manifest.ini,
+        if it has one, are checked before and after each patch. Per-patch timings, sizes and errors
+        are collected in self.patch_report, and progress advances as each group finishes
+        (reported with a label of None, as it is not a new stage). Returns True if any patch applied.
+        """
+        self.stage("Applying patches")
+
+        groups = {}
+        for xdelta_file in sorted(self.xdelta_files):
+            matched_input = match_patch_target(xdelta_file, self.input_candidates)
+            if not matched_input:
+                self.on_log(f"No matching input for patch: {xdelta_file}")
+                continue
+            groups.setdefault(os.path.join(self.game_dir, matched_input), []).append(
+                os.path.join(self.mod_path, xdelta_file)
+            )
+
+        # Each target's pristine file is renamed to .bak; its patches read that and write the game file
+        manifest = load_mod_manifest(self.mod_path)
+        jobs = [
+            (self.backups[input_path], input_path, patch_paths, self.cache_limit_mb, manifest)
+            for input_path, patch_paths in groups.items()
+            if self.backup(input_path)
+        ]
+
+        self.patch_report = []
+        total = sum(len(patch_paths) for _, _, patch_paths, _, _ in jobs)
+        step = self.STAGES.index("Applying patches") + 1
+
+        def group_finished(job, reports):
+            for report in reports:
+                self.patch_report.append(report)
+                number = len(self.patch_report)
+                if report["result"]:
+                    source = "from cache" if report["result"] == "cached" else "decoded"
+                    size_mb = report["size"] / (1024 * 1024)
+                    self.on_log(
+                        f"Patched {report['target']} with {report['patch']} "
+                        f"({number}/{total}, {size_mb:.1f} MB {source}, {report['seconds']:.1f} s)"
+                    )
+                else:
+                    self.on_log(
+                        f"Patch invalid: {report['patch']} for {report['target']} ({number}/{total}, {report['error']})"
+                    )
+            pending.remove(job)
+            self.on_progress(step + (len(jobs) - len(pending)) / len(jobs), None)
+
+        pending = list(jobs)
+        if len(jobs) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+                    futures = {pool.submit(apply_patch_chain, *job): job for job in jobs}
+                    for future in as_completed(futures):
+                        group_finished(futures[future], future.result())
+            except Exception as e:
+                # Every job reads its pristine .bak, so rerunning the unfinished ones is safe
+                self.on_log(f"Parallel patching unavailable ({e}), patching the remaining files one at a time.")
+        for job in list(pending):
+            group_finished(job, apply_patch_chain(*job))
+
+        # A target none of whose patches applied goes straight back to its pristine file
+        for _, input_path, _, _, _ in jobs:
+            target = os.path.basename(input_path)
+            if not any(r["result"] for r in self.patch_report if r["target"] == target):
+                self.restore_file(input_path)
+
+        patched_any = any(report["result"] for report in self.patch_report)
+        if not patched_any:
+            self.on_log("No patches applied.")
+        else:
+            self.on_log("Patching complete.")
+        return patched_any
+
+    def stage_assets(self):
+        """Puts the mod's lang/ and sound/ folders in place, by linking or by incremental sync."""
+        self.stage("Staging mod assets")
+        if self.asset_mode != "copy":
+            try:
+                stage_mod_assets(self.mod_path, self.game_dir)
+            except Exception as e:
+                self.on_log(f"Staging failed: {e}")
+                self.on_message("error", "Staging Failed", f"Could not stage mod assets:\n\n{e}")
+            return
+
+        try:
+            unstage_mod_assets(self.game_dir)  # Drop links left by an earlier "link" launch
+        except Exception as e:
+            self.on_log(f"Unstage failed: {e}")
+
+        for folder_name in ASSET_FOLDERS:
+            source_folder = os.path.join(self.mod_path, folder_name)
+            target_folder = os.path.join(self.game_dir, folder_name)
+
+            if not os.path.exists(source_folder):
+                self.on_log(f"No {folder_name}/ folder in mod.")
+                continue
+
+            try:
+                if os.path.islink(target_folder):
+                    os.unlink(target_folder)
+                stats = sync_folder(source_folder, target_folder, use_hash=self.sync_hash)
+                self.on_log(
+                    f"Synced {folder_name}/ to game directory: {stats['copied']} copied, "
+                    f"{stats['deleted']} deleted, {stats['unchanged']} unchanged "
+                    f"({stats['bytes'] / (1024 * 1024):.1f} MB written)."
+                )
+                if stats["errors"]:
+                    raise OSError("\n".join(stats["errors"][:10]))
+            except Exception as e:
+                self.on_log(f"Copy failed ({folder_name}): {e}")
+                self.on_message("error", "Copy Failed", f"Could not copy {folder_name}/:\n\n{e}")
+
+    def copy_dlls(self):
+        """Copies the presence DLLs into the game directory if the mod ships them."""
+        self.stage("Copying DLLs")
+        for dll_name in ["NekoPresence.dll", "NekoPresence_x64.dll"]:
+            src = os.path.join(self.mod_path, dll_name)
+            dst = os.path.join(self.game_dir, dll_name)
+            if os.path.exists(src):
+                try:
+                    shutil.copy2(src, dst)
+                    self.on_log(f"Copied {dll_name} to game directory.")
+                except Exception as e:
+                    self.on_log(f"Failed to copy {dll_name}: {e}")
+                    self.on_message("error", "Copy Failed", f"Could not copy {dll_name}:\n\n{e}")
+
+    def clean_po(self):
+        """Deletes leftover .po translation files, including ones the mod just brought in."""
+        self.stage("Cleaning .po files")
+        try:
+            introduced = [
+                os.path.join(folder_name, rel_path)
+                for folder_name in ASSET_FOLDERS
+                for rel_path in find_po_files(os.path.join(self.mod_path, folder_name))
+            ]
+            record_po_files(self.game_dir, introduced)
+            deleted_po = clean_po_files(self.game_dir)
+            self.on_log(f"Deleted {len(deleted_po)} .po file(s).")
+        except Exception as e:
+            self.on_log(f"Failed to clean .po files: {e}")
+
+    def patch(self):
+        """Runs every stage before launch. Returns False if there was nothing to patch."""
+        if not self.prepare():
+            return False
+        self.apply_patches()
+        self.stage_assets()
+        self.copy_dlls()
+        self.clean_po()
+        flush_hash_cache()
+        return True
+
+    def launch(self):
+        """Starts the game. Returns the process, or None if it could not be started."""
+        self.stage("Game running")
+        try:
+            self.on_log(f"Launching: {self.main_exe}")
+            self.proc = subprocess.Popen([self.main_exe], cwd=self.game_dir)
+            return self.proc
+        except Exception as e:
+            self.on_log(f"Launch failed: {e}")
+            self.on_message(
+                "error", "Launch Failed", f"Could not launch the game:\n\n{self.main_exe}\n\nError: {e}"
+            )
+            return None
+
+    def restore(self):
+        """Puts the backed up game files and the game's own asset folders back."""
+        self.stage("Restoring game files")
+        for file_path in list(self.backups):
+            self.restore_file(file_path)
+
+        if self.asset_mode != "copy":
+            try:
+                unstage_mod_assets(self.game_dir)
+            except Exception as e:
+                self.on_log(f"Failed to unstage mod assets: {e}")
+                self.on_message("error", "Restore Failed", f"Could not restore the game's asset folders:\n\n{e}")
+        flush_hash_cache()
+
+    def run(self):
+        """
+        Patches, launches the game, waits for it to exit and restores the game files.
+        Blocks until the game closes, so call it from a worker thread when a UI is running.
+        Returns True if the game was launched.
+        """
+        if not self.patch():
+            return False
+
+        proc = self.launch()
+        if proc:
+            proc.wait()
+            self.on_log("Game closed.")
+
+        self.restore()
+        return proc is not None
+
+
+class ThumbnailCache:
+    """
+    Bounded LRU cache of decoded mod thumbnails, keyed by image path.
+    Images are decoded on first use so memory stays flat as the mod library grows.
+    """
+
+    def __init__(self, size, capacity):
+        self.size = size
+        self.capacity = capacity
+        self.images = OrderedDict()
+
+    def __contains__(self, path):
+        return path in self.images
+
+    def get(self, path):
+        """Returns the PhotoImage for path, decoding it if needed. Returns None for missing or bad images."""
+        if not path:
+            return None
+
+        if path in self.images:
+            self.images.move_to_end(path)
+            return self.images[path]
+
+        image = None
+        try:
+            image = ImageTk.PhotoImage(load_cached_image(path, self.size))
+        except Exception:
+            pass  # Silently skip bad images
+
+        self.images[path] = image
+        while len(self.images) > self.capacity:
+            self.images.popitem(last=False)
+        return image
+
+
+# ─────────────
+# Page Timers
+# ─────────────
+
+class PageScheduler:
+    """
+    Runs the repeating callbacks of every page (animations, video, scrolling) on the Tk loop,
+    but only while their page is on screen. App.show_frame pauses the old page and resumes the new one.
+    A callback may return False to stop, or a number of ms to use instead of its interval for the next run.
+    """
+
+    def __init__(self):
+        self.tasks = {}
+        self.shown = set()
+
+    def every(self, page, interval_ms, callback):
+        """Registers callback to run every interval_ms while page is shown. Returns the task for cancel()."""
+        task = {"page": page, "interval": interval_ms, "callback": callback, "after_id": None}
+        self.tasks.setdefault(page, []).append(task)
+        if page in self.shown:
+            self._schedule(task, 0)
+        return task
+
+    def cancel(self, task):
+        self._unschedule(task)
+        tasks = self.tasks.get(task["page"], [])
+        if task in tasks:
+            tasks.remove(task)
+
+    def resume(self, page):
+        self.shown.add(page)
+        for task in self.tasks.get(page, []):
+            if task["after_id"] is None:
+                self._schedule(task, 0)
+
+    def pause(self, page):
+        self.shown.discard(page)
+        for task in self.tasks.get(page, []):
+            self._unschedule(task)
+
+    def forget(self, page):
+        """Stops and drops every task of a page that is being destroyed."""
+        self.pause(page)
+        self.tasks.pop(page, None)
+
+    def _schedule(self, task, delay):
+        task["after_id"] = task["page"].after(int(delay), self._run, task)
+
+    def _unschedule(self, task):
+        if task["after_id"] is not None:
+            try:
+                task["page"].after_cancel(task["after_id"])
+            except tk.TclError:
+                pass  # Widget already destroyed
+            task["after_id"] = None
+
+    def _run(self, task):
+        task["after_id"] = None
+        try:
+            result = task["callback"]()
+        except Exception as e:
+            print(f"Timer on {task['page'].__class__.__name__} failed: {e}")
+            result = False
+
+        if result is False:
+            self.cancel(task)
+        elif task["page"] in self.shown:
+            delay = result if isinstance(result, (int, float)) and result is not True else task["interval"]
+            self._schedule(task, delay)
+
+
+page_timers = PageScheduler()
+
+
+# ─────────────
+# Animated Sprites
+# ─────────────
+
+DEFAULT_GIF_FRAME_MS = 100
+MIN_GIF_FRAME_MS = 20  # Browsers clamp 0-10 ms GIF delays the same way
+
+_gif_frames = {}
+
+
+def load_gif_frames(path):
+    """
+    Returns [(PhotoImage, duration_ms), ...] for every frame of a GIF.
+    Each GIF is decoded once and shared by every sprite that plays it.
+    """
+    frames = _gif_frames.get(path)
+    if frames is None:
+        frames = []
+        with Image.open(path) as gif:
+            for frame in ImageSequence.Iterator(gif):
+                duration = frame.info.get("duration") or DEFAULT_GIF_FRAME_MS
+                frames.append((ImageTk.PhotoImage(frame.copy().convert("RGBA")), max(duration, MIN_GIF_FRAME_MS)))
+        _gif_frames[path] = frames
+    return frames
+
+
+class AnimatedSprite:
+    """A Label that plays a GIF with each frame's own duration. Driven by a SpriteGroup rather than its own timer."""
+
+    def __init__(self, parent, gif_path, **label_options):
+        self.frames = load_gif_frames(gif_path)
+        self.label = tk.Label(parent, **label_options)
+        self.index = 0
+        self.next_due = None
+        if self.frames:
+            self.label.config(image=self.frames[0][0])
+
+    def advance(self, now):
+        """Shows the frame due at now (ms) and returns when the next one is due."""
+        if len(self.frames) < 2:
+            return float("inf")
+        if self.next_due is None:
+            self.next_due = now + self.frames[self.index][1]
+        if now < self.next_due:
+            return self.next_due
+
+        if now - self.next_due > 1000:
+            # Resumed after being hidden; restart timing instead of fast-forwarding
+            self.next_due = now
+        while now >= self.next_due:
+            self.index = (self.index + 1) % len(self.frames)
+            self.next_due += self.frames[self.index][1]
+        self.label.config(image=self.frames[self.index][0])
+        return self.next_due
+
+
+class SpriteGroup:
+    """
+    Advances every sprite on a page, plus any periodic jobs (like movement), from a single page timer
+    that wakes only when the next frame or job is due.
+    """
+
+    def __init__(self, page):
+        self.sprites = []
+        self.jobs = []
+        page_timers.every(page, 0, self.tick)
+
+    def add(self, sprite):
+        self.sprites.append(sprite)
+        return sprite
+
+    def every(self, interval_ms, callback):
+        """Runs callback every interval_ms. Like page timers, it may return a number of ms to wait instead."""
+        self.jobs.append({"interval": interval_ms, "callback": callback, "next_due": 0})
+
+    def tick(self):
+        now = time.perf_counter() * 1000
+        next_due = now + 1000
+
+        for sprite in self.sprites:
+            next_due = min(next_due, sprite.advance(now))
+
+        for job in self.jobs:
+            if now >= job["next_due"]:
+                result = job["callback"]()
+                delay = result if isinstance(result, (int, float)) and result is not True else job["interval"]
+                job["next_due"] = now + delay
+            next_due = min(next_due, job["next_due"])
+
+        return max(1, int(next_due - now))
+
+
+# ─────────────
+# Main UI Classes
+# ─────────────
+
+class MainPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg="grey")
+        self.controller = controller
+
+        # ────────────────────────────
+        # Title Label
+        # ────────────────────────────
+        title_label = tk.Label(
+            self,
+            text="Split Modding Program",
+            font=("Arial", 35, "bold"),
+            anchor="nw",
+            fg="black",
+            bg="grey",
+            padx=15,
+            pady=15
+        )
+        title_label.place(x=0, y=0)
+
+        # ────────────────────────────
+        # Load Banner Images
+        # ────────────────────────────
+        self.loader_img = create_faded_image(os.path.join(current_dir, "assets", "examplebanner.jpg"))
+        self.browser_img = create_faded_image(os.path.join(current_dir, "assets", "banner_dummy.png"))
+        self.settings_img = create_faded_image(
+            os.path.join(current_dir, "assets", "examplebanner.jpg"),
+            size=(300, 400)
+        )
+
+        # ────────────────────────────
+        # Button Style Defaults
+        # ────────────────────────────
+        button_font = ("Arial", 20, "bold")
+        button_opts = {
+            "font": button_font,
+            "compound": "center",
+            "borderwidth": 0,
+            "highlightthickness": 0
+        }
+
+        # ────────────────────────────
+        # Mod Loader Button
+        # ────────────────────────────
+        button_loader = tk.Button(
+            self,
+            image=self.loader_img,
+            text="Mod Loader",
+            command=lambda: controller.show_frame("ModLoader"),
+            **button_opts
+        )
+        button_loader.place(x=20, y=100)
+
+        # ────────────────────────────
+        # Mod Browser Button
+        # ────────────────────────────
+        button_browser = tk.Button(
+            self,
+            image=self.browser_img,
+            text="Mod Browser",
+            command=lambda: controller.show_frame("ModBrowser"),
+            **button_opts
+        )
+        button_browser.place(x=20, y=400)
+
+        # ────────────────────────────
+        # Settings Button
+        # ────────────────────────────
+        button_settings = tk.Button(
+            self,
+            image=self.settings_img,
+            text="Settings",
+            command=lambda: controller.show_frame("Settings"),
+            **button_opts
+        )
+        button_settings.place(x=900, y=100)
+
+        # ────────────────────────────
+        # Sound Buttons with Custom Handlers
+        # ────────────────────────────
+        def play_sound_and_switch(frame_name, sound_file):
+            """Helper to switch frame and play associated sound."""
+            controller.show_frame(frame_name)
+            wave_path = os.path.join(current_dir, f"Assets/{sound_file}")
+            try:
+                wave_obj = sa.WaveObject.from_wave_file(wave_path)
+                wave_obj.play()
+            except Exception as e:
+                print(f"Failed to play sound: {e}")
+
+        # Groovy Button
+        button_groovy = tk.Button(
+            self,
+            text="Groovy",
+            command=lambda: play_sound_and_switch("Groovy", "tvtime.wav"),
+            **button_opts
+        )
+        button_groovy.place(x=900, y=500)
+
+        # Glooby Button
+        button_glooby = tk.Button(
+            self,
+            text="Glooby",
+            command=lambda: play_sound_and_switch("Glooby", "didntpush.wav"),
+            **button_opts
+        )
+        button_glooby.place(x=1100, y=500)
+
+
+class ModLoader(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg="white")
+        self.controller = controller
+
+        # ────────────────
+        # Background Setup
+        # ────────────────
+        bg_path = os.path.join(current_dir, "assets", "background.jpg")
+        self.bg_canvas, self.bg_photo = add_scrolling_background(self, bg_path)
+
+        # ────────────────
+        # Config
+        # ────────────────
+        self.current_page = 0
+        self.mods_per_page = 6
+        self.thumbnail_size = THUMBNAIL_SIZE
+        self.mods_path = MODS_PATH
+        self.mod_data = []
+        self.scanned_mods = {}
+        self.scan_queue = queue.Queue()
+
+        # Current, previous and next page stay decoded; everything else is evicted
+        self.thumbnails = ThumbnailCache(self.thumbnail_size, capacity=self.mods_per_page * 3)
+        self.prefetch_queue = []
+
+        # ────────────────
+        # Title
+        # ────────────────
+        title_label = tk.Label(
+            self,
+            text="Mod Loader Page",
+            font=("Arial", 35, "bold"),
+            fg="black",
+            bg="white",
+            anchor="nw",
+            padx=15,
+            pady=15
+        )
+        title_label.place(x=0, y=0)
+
+        # ────────────────
+        # Back Button
+        # ────────────────
+        back_btn = tk.Button(
+            self,
+            text="Back",
+            font=("Arial", 20),
+            command=lambda: controller.show_frame("MainPage")
+        )
+        back_btn.place(x=1100, y=28)
+
+        # ────────────────
+        # Scan Status
+        # ────────────────
+        self.status_label = tk.Label(
+            self,
+            text="Scanning…",
+            font=("Arial", 20),
+            fg="black",
+            bg="white"
+        )
+        self.status_label.place(relx=0.5, y=40, anchor="n")
+
+        # ────────────────
+        # Mod Button Grid Container
+        # ────────────────
+        self.button_frame = tk.Frame(self, bg="white")
+        self.button_frame.place(relx=0.5, rely=0.5, anchor="center")
+
+        # ────────────────
+        # Navigation Arrows
+        # ────────────────
+        self.prev_btn = tk.Button(
+            self,
+            text="←",
+            font=("Arial", 20),
+            command=self.prev_page
         )
         self.prev_btn.place(x=50, rely=0.95, anchor="sw")
 
@@ -529,84 +2950,59 @@ class ModLoader(tk.Frame):
         # Load First Page
         # ────────────────
         self.display_mods()
+        self.load_mods()
 
     def load_mods(self):
         """
-        Loads mod metadata and thumbnails from the mods folder.
-        Looks for a 'mod.ini' file and 'thumbnail.jpg' in each mod subdirectory.
+        Starts scanning the mods folder on a background thread.
+        Mods stream back through scan_queue and are added to the grid by poll_scan.
+        Thumbnails are decoded later, one page at a time, by display_mods.
         """
-        mods = []
-
-        if not os.path.exists(self.mods_path):
-            return mods
-
-        for mod_dir in os.listdir(self.mods_path):
-            mod_path = os.path.join(self.mods_path, mod_dir)
-            if not os.path.isdir(mod_path):
-                continue
+        def scan():
+            try:
+                scan_mods(
+                    self.mods_path,
+                    on_mod=lambda index, mod_info: self.scan_queue.put(("mod", index, mod_info)),
+                    thumbnail_size=self.thumbnail_size
+                )
+            except Exception as e:
+                print(f"Mod scan failed: {e}")
+            self.scan_queue.put(("done", None, None))
 
-            # Find mod.ini recursively
-            ini_path = None
-            for root, dirs, files in os.walk(mod_path):
-                for file in files:
-                    if file.lower() == "mod.ini":
-                        ini_path = os.path.join(root, file)
-                        break
-                if ini_path:
-                    break
+        threading.Thread(target=scan, daemon=True).start()
+        self.after(50, self.poll_scan)
 
-            image_path = os.path.join(mod_path, "thumbnail.jpg")
-
-            # Default mod metadata
-            mod_info = {
-                "name": "Unknown Mod",
-                "description": "",
-                "video_link": "",
-                "author": "",
-                "date_made": "",
-                "version": "",
-                "like_count": 0,
-                "game_version": "",
-                "download_count": 0,
-                "link": "",
-                "image": None
-            }
+    def poll_scan(self):
+        """Moves scanned mods from scan_queue into the grid, then reschedules itself until the scan ends."""
+        done = False
+        added = False
+        while True:
+            try:
+                kind, index, mod_info = self.scan_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "done":
+                done = True
+            else:
+                self.scanned_mods[index] = mod_info
+                added = True
 
-            # Load INI metadata if available
-            if ini_path and os.path.exists(ini_path):
-                config = configparser.ConfigParser()
-                config.optionxform = str  # Preserve case sensitivity
-                config.read(ini_path)
-
-                if config.has_section("Mod"):
-                    get = lambda key, fallback="": config.get("Mod", key, fallback=fallback)
-                    getint = lambda key, fallback=0: int(config.get("Mod", key, fallback=str(fallback)) or fallback)
-
-                    mod_info.update({
-                        "name": get("name", "Unknown Mod"),
-                        "description": get("description"),
-                        "video_link": get("video_link"),
-                        "author": get("author"),
-                        "date_made": get("date_made"),
-                        "version": get("version"),
-                        "like_count": getint("like_count"),
-                        "game_version": get("game_version"),
-                        "download_count": getint("download_count"),
-                        "link": get("link"),
-                        "mod_path": mod_path
-                    })
-
-            # Load thumbnail image
-            if os.path.exists(image_path):
-                try:
-                    img = Image.open(image_path).resize(self.thumbnail_size, Image.LANCZOS)
-                    mod_info["image"] = ImageTk.PhotoImage(img)
-                except Exception:
-                    pass  # Silently skip bad images
+        if added:
+            start = self.current_page * self.mods_per_page
+            end = start + self.mods_per_page
+            visible = self.mod_data[start:end]
 
-            mods.append(mod_info)
+            self.mod_data = [self.scanned_mods[index] for index in sorted(self.scanned_mods)]
+            if self.mod_data[start:end] != visible:
+                self.display_mods()
+            else:
+                self.update_nav()
+                self.schedule_prefetch()
 
-        return mods
+        if done:
+            self.status_label.place_forget()
+        else:
+            self.after(50, self.poll_scan)
 
     def display_mods(self):
         """
@@ -647,7 +3043,7 @@ class ModLoader(tk.Frame):
                 wrapper,
                 text=mod["name"],
                 font=("Arial", 24, "bold"),
-                image=mod["image"],
+                image=self.thumbnails.get(mod["thumbnail"]),
                 compound="top",
                 wraplength=480,
                 relief="raised",
@@ -658,7 +3054,11 @@ class ModLoader(tk.Frame):
             )
             btn.pack(fill="both", expand=True)
 
-        # Update nav arrows
+        self.update_nav()
+        self.schedule_prefetch()
+
+    def update_nav(self):
+        """Enables or disables the page arrows for the current page."""
         self.prev_btn.config(state="normal" if self.current_page > 0 else "disabled")
 
         total_pages = len(self.mod_data) // self.mods_per_page
@@ -667,6 +3067,33 @@ class ModLoader(tk.Frame):
 
         self.next_btn.config(state="normal" if self.current_page < total_pages - 1 else "disabled")
 
+    def schedule_prefetch(self):
+        """
+        Queues the thumbnails of the next and previous pages for decoding.
+        Decoding runs one image per idle callback so page flips stay responsive.
+        """
+        restart = not self.prefetch_queue
+        self.prefetch_queue = []
+
+        for page in (self.current_page + 1, self.current_page - 1):
+            if page < 0:
+                continue
+            start = page * self.mods_per_page
+            for mod in self.mod_data[start:start + self.mods_per_page]:
+                if mod["thumbnail"] and mod["thumbnail"] not in self.thumbnails:
+                    self.prefetch_queue.append(mod["thumbnail"])
+
+        if restart and self.prefetch_queue:
+            self.after_idle(self.prefetch_next)
+
+    def prefetch_next(self):
+        """Decodes one queued thumbnail and reschedules itself until the queue is empty."""
+        if not self.prefetch_queue:
+            return
+        self.thumbnails.get(self.prefetch_queue.pop(0))
+        if self.prefetch_queue:
+            self.after_idle(self.prefetch_next)
+
     def next_page(self):
         """Switch to the next page of mods."""
         self.current_page += 1
@@ -726,6 +3153,7 @@ class ModPage(tk.Frame):
             command=self.patch_mod
         )
         self.patch_btn.place(x=1000, y=600)
+        self.progress_dialog = None
 
         # ────────────────
         # Navigation Buttons
@@ -774,7 +3202,11 @@ class ModPage(tk.Frame):
         self.desc.insert("1.0", mod["description"])
 
     def patch_mod(self):
-        """Applies xdelta patches and assets from the selected mod."""
+        """
+        Applies xdelta patches and assets from the selected mod, then launches the game.
+        The work runs on a PatchPipeline in a background thread; progress is shown in a
+        dialog and the backups are restored when the game exits, without blocking the UI.
+        """
         mod = self.controller.selected_mod
         mod_path = mod.get("mod_path")
 
@@ -785,323 +3217,288 @@ class ModPage(tk.Frame):
         # ────────────────
         # Load game_dir from split.ini
         # ────────────────
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        split_ini_path = os.path.join(script_dir, "split.ini")
-
-        game_dir = None
-        if os.path.exists(split_ini_path):
-            config = configparser.ConfigParser()
-            config.optionxform = str
-            config.read(split_ini_path)
-            if config.has_section("Paths") and config.has_option("Paths", "game_dir"):
-                game_dir = config.get("Paths", "game_dir")
-                print(f"Loaded game_dir from split.ini: {game_dir}")
+        config = load_split_config()
+        game_dir = config.get("Paths", "game_dir", fallback=None)
+        if game_dir:
+            print(f"Loaded game_dir from split.ini: {game_dir}")
 
         if not game_dir or not os.path.isdir(game_dir):
             print("Invalid or missing game_dir. Cannot patch.")
             return
 
         # ────────────────
-        # Find patch files and targets
+        # Run the pipeline off the Tk thread
         # ────────────────
-        xdelta_files = [f for f in os.listdir(mod_path) if f.endswith(".xdelta")]
-        input_candidates = [
-            f for f in os.listdir(game_dir)
-            if f.lower().endswith((".exe", ".win")) and os.path.isfile(os.path.join(game_dir, f))
-        ]
+        events = queue.Queue()
+
+        def on_log(message):
+            print(message)
+            events.put(("log", message, None))
+
+        pipeline = PatchPipeline(
+            mod_path,
+            game_dir,
+            config,
+            on_log=on_log,
+            on_progress=lambda step, label: events.put(("progress", step, label)),
+            on_message=lambda kind, title, message: events.put((kind, title, message))
+        )
 
-        if not xdelta_files or not input_candidates:
-            print("No patches or no valid input files found.")
-            return
+        def run_pipeline():
+            try:
+                pipeline.run()
+            except Exception as e:
+                print(f"Patch pipeline failed: {e}")
+                events.put(("error", "Patch Failed", str(e)))
+            events.put(("done", None, None))
+
+        self.patch_btn.config(state="disabled")
+        self.progress_dialog = LoadingScreen(self, total_steps=len(PatchPipeline.STAGES), title="Patching mod...", hide_on_close=True)
+        threading.Thread(target=run_pipeline, daemon=True).start()
+        self.after(100, lambda: self.poll_patch(events))
+
+    def poll_patch(self, events):
+        """Shows pipeline progress and messages from the worker thread, rescheduling itself until it finishes."""
+        finished = False
+        # Keep draining events even if the dialog is gone, so errors still show and the button comes back
+        dialog = self.progress_dialog if self.progress_dialog and self.progress_dialog.winfo_exists() else None
+        while True:
+            try:
+                kind, first, second = events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "log":
+                if dialog:
+                    dialog.log(first)
+            elif kind == "progress":
+                if dialog:
+                    dialog.update_progress(first)
+                    if second:
+                        dialog.log(f"── {second} ──")
+            elif kind == "error":
+                messagebox.showerror(first, second)
+            elif kind == "warning":
+                messagebox.showwarning(first, second)
+            elif kind == "done":
+                finished = True
+
+        if finished:
+            if dialog:
+                dialog.destroy()
+            self.progress_dialog = None
+            self.patch_btn.config(state="normal")
+        else:
+            self.after(100, lambda: self.poll_patch(events))
+
+
+class ModBrowser(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg="white")
+        self.controller = controller
+
+        # ────────────────
+        # Background Setup
+        # ────────────────
+        bg_path = os.path.join(current_dir, "assets", "background.jpg")
+        self.bg_canvas, self.bg_photo = add_scrolling_background(self, bg_path)
+
+        # ────────────────
+        # Config
+        # ────────────────
+        self.current_page = 0
+        self.mods_per_page = 6
+        self.thumbnail_size = THUMBNAIL_SIZE
+        query = load_split_config().get("Browser", "query", fallback=BROWSER_QUERY)
+
+        # Search pages and thumbnails load on worker threads; poll() picks them up while the page is shown
+        self.search = ModSearch(query, per_page=self.mods_per_page)
+        self.fetcher = ThumbnailFetcher(self.thumbnail_size)
+        self.photos = OrderedDict()  # url -> PhotoImage, current and neighbouring pages only
+        self.cards = {}  # url -> buttons on screen waiting for that thumbnail
+        page_timers.every(self, 50, self.poll)
+
+        # ────────────────
+        # Title
+        # ────────────────
+        title_label = tk.Label(
+            self,
+            text="Mod Browser Page",
+            font=("Arial", 35, "bold"),
+            fg="black",
+            bg="white",
+            anchor="nw",
+            padx=15,
+            pady=15
+        )
+        title_label.place(x=0, y=0)
+
+        # ────────────────
+        # Back Button
+        # ────────────────
+        back_btn = tk.Button(
+            self,
+            text="Back",
+            font=("Arial", 20),
+            command=lambda: controller.show_frame("MainPage")
+        )
+        back_btn.place(x=1100, y=28)
 
         # ────────────────
-        # Determine main EXE file
+        # Load Status
         # ────────────────
-        exe_candidates = [
-            f for f in os.listdir(game_dir)
-            if f.lower().endswith(".exe") and "unins" not in f.lower() and "setup" not in f.lower()
-        ]
-
-        main_exe = None
-        for f in exe_candidates:
-            if any(f.lower() in x.lower() for x in xdelta_files):
-                main_exe = os.path.join(game_dir, f)
-                break
-        if not main_exe and exe_candidates:
-            main_exe = os.path.join(game_dir, exe_candidates[0])
-
-        if not main_exe:
-            messagebox.showwarning("Game Not Launched", "No .exe file found in game directory.")
-            return
+        self.status_label = tk.Label(
+            self,
+            text="Loading…",
+            font=("Arial", 20),
+            fg="black",
+            bg="white"
+        )
+        self.status_label.place(relx=0.5, y=40, anchor="n")
 
         # ────────────────
-        # Backup critical files
+        # Mod Button Grid Container
         # ────────────────
-        backup_files = []
-        for file_name in [os.path.basename(main_exe), "data.win"]:
-            original_path = os.path.join(game_dir, file_name)
-            if os.path.exists(original_path):
-                backup_path = original_path + ".bak"
-                try:
-                    shutil.copy2(original_path, backup_path)
-                    backup_files.append((original_path, backup_path))
-                    print(f"Backed up {file_name} to {backup_path}")
-                except Exception as e:
-                    print(f"Failed to back up {file_name}: {e}")
-                    messagebox.showerror("Backup Failed", f"Could not back up {file_name}:\n\n{e}")
+        self.button_frame = tk.Frame(self, bg="white")
+        self.button_frame.place(relx=0.5, rely=0.5, anchor="center")
 
         # ────────────────
-        # Apply patches
+        # Navigation Arrows
         # ────────────────
-        patched_any = False
-        for xdelta_file in xdelta_files:
-            patch_path = os.path.join(mod_path, xdelta_file)
+        self.prev_btn = tk.Button(
+            self,
+            text="←",
+            font=("Arial", 20),
+            command=self.prev_page
+        )
+        self.prev_btn.place(x=50, rely=0.95, anchor="sw")
 
-            matched_input = next((f for f in input_candidates if f.lower() in xdelta_file.lower()), None)
-            if not matched_input:
-                print(f"No matching input for patch: {xdelta_file}")
-                continue
+        self.next_btn = tk.Button(
+            self,
+            text="→",
+            font=("Arial", 20),
+            command=self.next_page
+        )
+        self.next_btn.place(x=1230, rely=0.95, anchor="se")
 
-            input_path = os.path.join(game_dir, matched_input)
+    def on_show(self):
+        self.show_page(self.current_page)
+
+    def on_hide(self):
+        # Nothing on screen needs thumbnails any more; drop whatever is still queued
+        self.fetcher.new_generation()
+
+    def show_page(self, page):
+        """Shows a page of results if it's loaded, otherwise asks for it and shows it once poll() gets it."""
+        self.current_page = page
+        self.fetcher.new_generation()
+        mods = self.search.request(page)
+        if mods is None:
+            self.status_label.config(text="Loading…")
+            self.status_label.place(relx=0.5, y=40, anchor="n")
+            self.display_mods([])
+        else:
+            self.status_label.place_forget()
+            self.display_mods(mods)
+        self.prefetch_thumbnails()
 
-            if not is_patch_valid(input_path, patch_path):
-                print(f"Patch invalid: {xdelta_file} for {matched_input}")
-                continue
+    def display_mods(self, mods):
+        """
+        Clears the current mod grid and displays the given mods, queueing any thumbnails not yet loaded.
+        """
+        for widget in self.button_frame.winfo_children():
+            widget.destroy()
+        self.cards = {}
 
-            try:
-                fd, temp_output_path = tempfile.mkstemp()
-                os.close(fd)
-                try:
-                    pyxdelta.decode(input_path, patch_path, temp_output_path)
-                    shutil.move(temp_output_path, input_path)
-                    print(f"Patched {matched_input} with {xdelta_file}")
-                    patched_any = True
-                except Exception as e:
-                    print(f"Failed patch: {e}")
-                    if os.path.exists(temp_output_path):
-                        os.remove(temp_output_path)
-            except Exception as e:
-                print(f"Patch error: {e}")
+        self.button_frame.config(width=800, height=500)
+        self.button_frame.pack_propagate(False)
 
-        if not patched_any:
-            print("No patches applied.")
-        else:
-            print("Patching complete.")
+        for idx, mod in enumerate(mods):
+            row = idx // 3
+            col = idx % 3
 
-        # ────────────────
-        # Copy folders like lang/ and sound/
-        # ────────────────
-        for folder_name in ["lang", "sound"]:
-            source_folder = os.path.join(mod_path, folder_name)
-            target_folder = os.path.join(game_dir, folder_name)
+            wrapper = tk.Frame(
+                self.button_frame,
+                width=490,
+                height=480,
+                bg=self["bg"],
+                highlightthickness=0,
+                bd=0
+            )
+            wrapper.grid(row=row, column=col, padx=20, pady=20)
+            wrapper.grid_propagate(False)
 
-            if os.path.exists(source_folder):
-                try:
-                    if os.path.exists(target_folder):
-                        shutil.rmtree(target_folder)
-                    shutil.copytree(source_folder, target_folder)
-                    print(f"Copied {folder_name}/ to game directory.")
-                except Exception as e:
-                    print(f"Copy failed ({folder_name}): {e}")
-                    messagebox.showerror("Copy Failed", f"Could not copy {folder_name}/:\n\n{e}")
-            else:
-                print(f"No {folder_name}/ folder in mod.")
+            url = mod["thumbnail_url"]
+            if url in self.photos:
+                self.photos.move_to_end(url)
+            btn = tk.Button(
+                wrapper,
+                text=mod["name"],
+                font=("Arial", 24, "bold"),
+                image=self.photos.get(url),
+                compound="top",
+                wraplength=480,
+                relief="raised",
+                bd=0,
+                bg=wrapper["bg"],
+                activebackground=wrapper["bg"],
+                command=partial(self.open_mod, mod)
+            )
+            btn.pack(fill="both", expand=True)
 
-        # ────────────────
-        # Copy presence DLLs if found
-        # ────────────────
-        for dll_name in ["NekoPresence.dll", "NekoPresence_x64.dll"]:
-            src = os.path.join(mod_path, dll_name)
-            dst = os.path.join(game_dir, dll_name)
-            if os.path.exists(src):
-                try:
-                    shutil.copy2(src, dst)
-                    print(f"Copied {dll_name} to game directory.")
-                except Exception as e:
-                    print(f"Failed to copy {dll_name}: {e}")
-                    messagebox.showerror("Copy Failed", f"Could not copy {dll_name}:\n\n{e}")
+            if url and url not in self.photos:
+                self.cards.setdefault(url, []).append(btn)
+                self.fetcher.request(url, priority=0)
+
+        self.update_nav()
+
+    def prefetch_thumbnails(self):
+        """Queues the next page's thumbnails behind the visible ones."""
+        for mod in self.search.pages.get(self.current_page + 1) or []:
+            if mod["thumbnail_url"] and mod["thumbnail_url"] not in self.photos:
+                self.fetcher.request(mod["thumbnail_url"], priority=1)
+
+    def poll(self):
+        """Puts finished search pages and thumbnails on screen. Runs on a page timer while the browser is shown."""
+        for kind, page, error in self.search.poll():
+            if page != self.current_page:
+                if page == self.current_page + 1:
+                    self.prefetch_thumbnails()
+                    self.update_nav()
+                continue
+            if kind == "error":
+                self.status_label.config(text=f"Failed to load mods: {error}")
+                continue
+            self.status_label.place_forget()
+            self.display_mods(self.search.pages[page])
+            self.prefetch_thumbnails()
 
-        # ────────────────
-        # Delete leftover .po translation files
-        # ────────────────
-        deleted_po_count = 0
-        for root, _, files in os.walk(game_dir):
-            for file in files:
-                if file.endswith(".po"):
-                    try:
-                        os.remove(os.path.join(root, file))
-                        deleted_po_count += 1
-                    except Exception as e:
-                        print(f"Failed to delete {file}: {e}")
-        print(f"Deleted {deleted_po_count} .po file(s).")
+        for url, image in self.fetcher.poll():
+            if image is None or url in self.photos:
+                continue
+            self.photos[url] = ImageTk.PhotoImage(image)
+            while len(self.photos) > self.mods_per_page * 3:
+                self.photos.popitem(last=False)
+            for btn in self.cards.pop(url, []):
+                btn.config(image=self.photos[url])
+
+    def update_nav(self):
+        """Enables or disables the page arrows for the current page."""
+        self.prev_btn.config(state="normal" if self.current_page > 0 else "disabled")
+        self.next_btn.config(state="normal" if self.search.has_page(self.current_page + 1) else "disabled")
 
-        # ────────────────
-        # Launch Game
-        # ────────────────
-        try:
-            print(f"Launching: {main_exe}")
-            proc = subprocess.Popen([main_exe], cwd=game_dir)
-            proc.wait()
-            print("Game closed.")
-        except Exception as e:
-            print(f"Launch failed: {e}")
-            messagebox.showerror("Launch Failed", f"Could not launch the game:\n\n{main_exe}\n\nError: {e}")
-            return
+    def open_mod(self, mod):
+        """Opens the mod's GameBanana page in the default web browser."""
+        if mod["url"]:
+            webbrowser.open(mod["url"])
 
-        # ────────────────
-        # Restore backups
-        # ────────────────
-        for original, backup in backup_files:
-            try:
-                shutil.move(backup, original)
-                print(f"Restored {backup} → {original}")
-            except Exception as e:
-                print(f"Failed to restore {backup}: {e}")
-                messagebox.showerror("Restore Failed", f"Could not restore file:\n\n{backup}\n\nError: {e}")
-
-
-# class ModBrowser(tk.Frame):
-#     def __init__(self, parent, controller):
-#         super().__init__(parent, bg="white")
-#         self.controller = controller
-#         self.api = PyBanana()  # GameBanana API client
-#         self.current_page = 0
-#         self.mods_per_page = 6
-#         self.thumbnail_size = (400, 250)
-#         self.mod_images = []  # prevent garbage collection of thumbnails
-#
-#         # Scrolling background (shared with ModLoader)
-#         bg_path = os.path.join(current_dir, "assets", "background.jpg")
-#         self.bg_canvas, self.bg_photo = add_scrolling_background(self, bg_path)
-#
-#         # Title + Back button
-#         tk.Label(self,
-#                  text="Mod Browser Page",
-#                  font=("Arial", 35, "bold"),
-#                  fg="black", bg="white",
-#                  anchor="nw",
-#                  padx=15, pady=15).place(x=0, y=0)
-#
-#         tk.Button(self,
-#                   text="Back",
-#                   font=("Arial", 20),
-#                   command=lambda: controller.show_frame("MainPage")) \
-#             .place(x=1100, y=28)
-#
-#         # Container for mod cards
-#         self.button_frame = tk.Frame(self, bg="white")
-#         self.button_frame.place(relx=0.5, rely=0.5, anchor="center")
-#
-#         # Navigation buttons
-#         self.prev_btn = tk.Button(self, text="←", font=("Arial", 20),
-#                                   command=self.prev_page)
-#         self.prev_btn.place(x=50, rely=0.95, anchor="sw")
-#
-#         self.next_btn = tk.Button(self, text="→", font=("Arial", 20),
-#                                   command=self.next_page)
-#         self.next_btn.place(x=1230, rely=0.95, anchor="se")
-#
-#         # Load mods
-#         self.fetch_mods()
-#
-#     def fetch_mods(self):
-#         """Fetch mod data from GameBanana API and store it."""
-#         try:
-#             results = self.api.search(
-#                 query="pizza tower",
-#                 model=ModelType.MOD,
-#                 order=OrderResult.RELEVANCE,
-#                 page=1,
-#                 per_page=100
-#             )
-#
-#             self.all_mods = []
-#             for mod in results.records:
-#                 mod_info = {
-#                     "name": mod.name,
-#                     "url": mod.url,
-#                     "profile_url": getattr(mod, "profile_url", None),
-#                     "creator": getattr(mod, "owner_name", "Unknown"),
-#                     "posted": str(mod.date),
-#                     "description": (mod.description or "")[:100]
-#                 }
-#
-#                 # Try loading a thumbnail if available
-#                 try:
-#                     if mod_info["profile_url"]:
-#                         image_data = requests.get(mod_info["profile_url"], timeout=5).content
-#                         img = Image.open(io.BytesIO(image_data)).resize(self.thumbnail_size, Image.LANCZOS)
-#                         photo = ImageTk.PhotoImage(img)
-#                         mod_info["image"] = photo
-#                         self.mod_images.append(photo)  # Store reference
-#                     else:
-#                         mod_info["image"] = None
-#                 except Exception as e:
-#                     print(f"Failed to load image: {e}")
-#                     mod_info["image"] = None
-#
-#                 self.all_mods.append(mod_info)
-#
-#             self.display_mods()
-#
-#         except Exception as e:
-#             print(f"Error fetching mods: {e}")
-#             self.all_mods = []
-#
-#     def display_mods(self):
-#         """Displays the current page of mods in a button grid."""
-#         for widget in self.button_frame.winfo_children():
-#             widget.destroy()
-#
-#         self.button_frame.config(width=800, height=500)
-#         self.button_frame.pack_propagate(False)
-#
-#         start = self.current_page * self.mods_per_page
-#         end = start + self.mods_per_page
-#         current_mods = self.all_mods[start:end]
-#
-#         for idx, mod in enumerate(current_mods):
-#             row = idx // 3
-#             col = idx % 3
-#
-#             wrapper = tk.Frame(self.button_frame,
-#                                width=490,
-#                                height=480,
-#                                bg=self["bg"],
-#                                highlightthickness=0,
-#                                bd=0)
-#             wrapper.grid(row=row, column=col, padx=20, pady=20)
-#             wrapper.grid_propagate(False)
-#
-#             btn = tk.Button(wrapper,
-#                             text=mod["name"],
-#                             font=("Arial", 24, "bold"),
-#                             image=mod.get("image"),
-#                             compound="top",
-#                             wraplength=480,
-#                             relief="raised",
-#                             bd=0,
-#                             bg=wrapper["bg"],
-#                             activebackground=wrapper["bg"],
-#                             command=lambda name=mod["name"]: print(f"{name} clicked"))
-#             btn.pack(fill="both", expand=True)
-#
-#         total_pages = len(self.all_mods) // self.mods_per_page
-#         if len(self.all_mods) % self.mods_per_page:
-#             total_pages += 1
-#
-#         self.prev_btn.config(state="normal" if self.current_page > 0 else "disabled")
-#         self.next_btn.config(state="normal" if self.current_page < total_pages - 1 else "disabled")
-#
-#     def next_page(self):
-#         """Switch to the next page."""
-#         self.current_page += 1
-#         self.display_mods()
-#
-#     def prev_page(self):
-#         """Switch to the previous page."""
-#         self.current_page -= 1
-#         self.display_mods()
+    def next_page(self):
+        """Switch to the next page of mods."""
+        self.show_page(self.current_page + 1)
+
+    def prev_page(self):
+        """Switch to the previous page of mods."""
+        self.show_page(self.current_page - 1)
 
 
 class Settings(tk.Frame):
@@ -1149,56 +3546,147 @@ class Settings(tk.Frame):
                   font=("Arial", 20, "bold"),
                   command=make_compatible).place(x=800, y=200)
 
+        tk.Button(self,
+                  text="Batch convert",
+                  font=("Arial", 20, "bold"),
+                  command=self.batch_convert).place(x=800, y=300)
+
+        tk.Button(self,
+                  text="Refresh stats",
+                  font=("Arial", 20, "bold"),
+                  command=self.refresh_stats).place(x=800, y=400)
+
+        def clear_cache():
+            """Deletes cached thumbnails and banners after asking for confirmation."""
+            if not messagebox.askokcancel(message="Clear the image cache?"):
+                return
+            freed = clear_image_cache()
+            messagebox.showinfo("Cache Cleared", f"Freed {freed / (1024 * 1024):.1f} MB.")
+
+        tk.Button(self,
+                  text="Clear cache",
+                  font=("Arial", 20, "bold"),
+                  command=clear_cache).place(x=300, y=300)
+
         tk.Button(self,
                   text="Back",
                   font=("Arial", 20),
                   command=lambda: controller.show_frame("MainPage")).place(x=1100, y=28)
 
+        self.batch_dialog = None
+
+    def batch_convert(self):
+        """
+        Converts every mod in mods/ at once, using a folder,mod_id CSV if the user picks one and
+        otherwise the IDs found in mod.ini links and folder names. Runs off the Tk thread.
+        """
+        csv_path = None
+        if messagebox.askyesno("Batch Convert", "Use a CSV file mapping folders to mod IDs?\n"
+                                                "Choose No to detect IDs from the mods folder."):
+            csv_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
+            if not csv_path:
+                return
+
+        try:
+            jobs, skipped = find_conversion_jobs(MODS_PATH, csv_path)
+        except Exception as e:
+            messagebox.showerror("Batch Convert", f"Failed to read mod list: {e}")
+            return
+        if not jobs:
+            messagebox.showinfo("Batch Convert", "No mods with a GameBanana ID were found.")
+            return
+
+        def convert(on_result):
+            return conversion_report(convert_mods(jobs, on_result=on_result), skipped)
+
+        def describe(result):
+            folder = os.path.basename(os.path.normpath(result["mod_dir"]))
+            return f"{'Failed' if result['error'] else 'Converted'}: {folder}"
+
+        self.run_batch("Batch Convert", len(jobs), convert, describe)
+
+    def refresh_stats(self):
+        """Updates like and download counts for every mod from GameBanana, reusing recently cached profiles."""
+        try:
+            jobs = find_stats_jobs(MODS_PATH)
+        except Exception as e:
+            messagebox.showerror("Refresh Stats", f"Failed to read mod list: {e}")
+            return
+        if not jobs:
+            messagebox.showinfo("Refresh Stats", "No mods with a GameBanana ID were found.")
+            return
+
+        def refresh(on_result):
+            return stats_report(refresh_mod_stats(jobs, on_result=on_result))
+
+        def describe(result):
+            folder = os.path.basename(os.path.normpath(result["mod_dir"]))
+            return f"{result['status'].capitalize()}: {folder}"
+
+        self.run_batch("Refresh Stats", len(jobs), refresh, describe)
+
+    def run_batch(self, title, total_steps, work, describe):
+        """
+        Runs work(on_result) on a worker thread behind a progress dialog. Each result is logged with
+        describe(result); the report text work returns is shown when it finishes.
+        """
+        events = queue.Queue()
+
+        def run():
+            try:
+                report = work(lambda result: events.put(("result", result)))
+            except Exception as e:
+                report = f"{title} failed: {e}"
+            events.put(("done", report))
+
+        self.batch_dialog = LoadingScreen(self, total_steps=total_steps, title=f"{title}...", hide_on_close=True)
+        threading.Thread(target=run, daemon=True).start()
+        self.after(100, lambda: self.poll_batch(title, events, describe, 0))
+
+    def poll_batch(self, title, events, describe, finished):
+        """Logs each result from the worker thread and shows the report once the batch ends."""
+        dialog = self.batch_dialog if self.batch_dialog and self.batch_dialog.winfo_exists() else None
+        while True:
+            try:
+                kind, payload = events.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "result":
+                finished += 1
+                if dialog:
+                    dialog.log(describe(payload))
+                    dialog.update_progress(finished)
+            elif kind == "done":
+                if dialog:
+                    dialog.destroy()
+                self.batch_dialog = None
+                print(payload)
+                messagebox.showinfo(title, payload)
+                return
+
+        self.after(100, lambda: self.poll_batch(title, events, describe, finished))
+
 
 class Groovy(tk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent, bg="white")
         self.controller = controller
-        self.animations = []
+        self.sprites = SpriteGroup(self)
 
-        # Load all gifs and create labels, but defer placement to move()
+        # Create a sprite per gif, but defer placement to move()
         for num in range(1, 4):
             gif_path = os.path.join(current_dir, f"Assets/tenna{num}.gif")
-            gif = Image.open(gif_path)
-            frames = [ImageTk.PhotoImage(f.copy().convert("RGBA")) for f in ImageSequence.Iterator(gif)]
-
-            label = tk.Label(self, bg="white", borderwidth=0)
-            # Do NOT place here, will place later in move()
-
-            self.animations.append({
-                "frames": frames,
-                "frame_index": 0,
-                "label": label
-            })
-
-        # Start animation and movement for each GIF
-        for i in range(len(self.animations)):
-            self.animate(i)
-            self.move(i)  # Call move with proper idx immediately
-
-    def animate(self, idx):
-        anim = self.animations[idx]
-        frame = anim["frames"][anim["frame_index"]]
-        anim["label"].config(image=frame)
-        anim["frame_index"] = (anim["frame_index"] + 1) % len(anim["frames"])
-        self.after(100, lambda: self.animate(idx))
-
-    def move(self, idx):
-        anim = self.animations[idx]
-        label = anim["label"]
+            sprite = self.sprites.add(AnimatedSprite(self, gif_path, bg="white", borderwidth=0))
+            self.sprites.every(500, lambda sprite=sprite: self.move(sprite))
 
+    def move(self, sprite):
         width = self.winfo_width()
         height = self.winfo_height()
 
         # If widget size not ready, try again shortly
         if width <= 100 or height <= 100:
-            self.after(100, lambda: self.move(idx))
-            return
+            return 100
 
         max_x = width - 100
         max_y = height - 100
@@ -1206,11 +3694,18 @@ class Groovy(tk.Frame):
         x = random.randint(0, max_x)
         y = random.randint(0, max_y)
 
-        label.place(x=x, y=y)
-        self.after(500, lambda: self.move(idx))
+        sprite.label.place(x=x, y=y)
 
 
 class Glooby(tk.Frame):
+    """
+    Plays Assets/didntpush.mp4. A producer thread decodes, resizes and colour-converts frames into a
+    small queue; the Tk side only paints them when they are due, so playback follows the video's FPS.
+    """
+    release_on_hide = True
+    FRAME_QUEUE_SIZE = 4
+    END_OF_VIDEO = object()
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg="black")
         self.controller = controller
@@ -1220,41 +3715,150 @@ class Glooby(tk.Frame):
         if not self.cap.isOpened():
             print("Failed to load video.")
 
-        self.label = tk.Label(self, bg="black")
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.frame_interval = 1 / fps if fps and fps > 0 else 1 / 30
+
+        self.label = tk.Label(self, bg="black", borderwidth=0, highlightthickness=0)
         self.label.pack(expand=True, fill="both")
-        self.update_frame()
-
-    def update_frame(self):
-        ret, frame = self.cap.read()
-        if ret:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            label_width, label_height = self.label.winfo_width(), self.label.winfo_height()
-            img = Image.fromarray(frame).resize((label_width, label_height), Image.Resampling.LANCZOS)
-            imgtk = ImageTk.PhotoImage(image=img)
-            self.label.imgtk = imgtk
-            self.label.config(image=imgtk)
-            self.after(33, self.update_frame)
-        else:
+        self.label.bind("<Configure>", self.on_resize)
+
+        self.target_size = None
+        self.start_time = None
+        self.pending = None
+        self.photo = None
+        self.dropped = 0
+
+        self.frames = queue.Queue(maxsize=self.FRAME_QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self.producer = threading.Thread(target=self.decode_frames, daemon=True)
+        self.producer.start()
+        page_timers.every(self, 5, self.show_next_frame)
+
+    def on_resize(self, event):
+        if event.width > 1 and event.height > 1:
+            self.target_size = (event.width, event.height)
+
+    def release(self):
+        """Stops playback, the decode thread and closes the video file."""
+        page_timers.forget(self)
+        self.stop_event.set()
+        # Unblock the producer if it's waiting on a full queue
+        try:
+            while True:
+                self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        self.producer.join(timeout=1)
+
+    def decode_frames(self):
+        """Producer thread: decodes frames, skipping the ones that are already late, and queues them at display size."""
+        size = None
+        interpolation = cv2.INTER_AREA
+        index = 0
+        try:
+            while not self.stop_event.is_set():
+                target = self.target_size
+                if target is None:
+                    # Label not laid out yet, nothing to size frames to
+                    self.stop_event.wait(0.01)
+                    continue
+
+                # Frames whose display time has already passed are skipped without decoding them
+                if self.start_time is not None and (index + 1) * self.frame_interval < time.perf_counter() - self.start_time:
+                    if not self.cap.grab():
+                        break
+                    index += 1
+                    self.dropped += 1
+                    continue
+
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+
+                if target != size:
+                    # Pick the interpolation once per size change: INTER_AREA to shrink, INTER_LINEAR to enlarge
+                    size = target
+                    height, width = frame.shape[:2]
+                    interpolation = cv2.INTER_AREA if size[0] * size[1] < width * height else cv2.INTER_LINEAR
+                if (frame.shape[1], frame.shape[0]) != size:
+                    frame = cv2.resize(frame, size, interpolation=interpolation)
+                image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+                self._put((index, image))
+                index += 1
+        except Exception as e:
+            print(f"Video decode failed: {e}")
+        finally:
             self.cap.release()
+            self._put(self.END_OF_VIDEO)
+
+    def _put(self, item):
+        while not self.stop_event.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def show_next_frame(self):
+        """Paints the newest frame that is due, dropping older due frames. Returns the ms until the next one is due."""
+        if self.start_time is None:
+            if self.frames.empty():
+                return 5
+            self.start_time = time.perf_counter()
+        elapsed = time.perf_counter() - self.start_time
+
+        shown = None
+        while True:
+            if self.pending is None:
+                try:
+                    self.pending = self.frames.get_nowait()
+                except queue.Empty:
+                    break
+            if self.pending is self.END_OF_VIDEO:
+                if shown is None:
+                    return False
+                break
+            index, image = self.pending
+            if index * self.frame_interval > elapsed:
+                break
+            if shown is not None:
+                self.dropped += 1
+            shown = image
+            self.pending = None
+
+        if shown is not None:
+            # Reuse the PhotoImage while the size holds; paste is far cheaper than building a new one
+            if self.photo is not None and (self.photo.width(), self.photo.height()) == shown.size:
+                self.photo.paste(shown)
+            else:
+                self.photo = ImageTk.PhotoImage(image=shown)
+                self.label.config(image=self.photo)
+
+        if self.pending is None or self.pending is self.END_OF_VIDEO:
+            return 5
+        index, _ = self.pending
+        return max(1, int((index * self.frame_interval - elapsed) * 1000))
 
 
 LOADING_STEPS = [
     "Setting default mod values...",
     "Initializing MainPage...",
-    "Initializing ModLoader...",
-    "Initializing ModBrowser...",
-    "Initializing ModPage...",
-    "Initializing Settings...",
-    "Initializing Groovy...",
-    "Initializing Glooby...",
     "Finalizing setup..."
 ]
 
+# Pages built in idle time once the main menu is up, so opening them the first time is instant.
+# Anything not listed here (Groovy, Glooby) is only built when the user actually opens it.
+PREWARM_PAGES = ("ModLoader", "ModPage", "Settings")
+PREWARM_DELAY_MS = 250
+
 
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
-        self.frames = None
+        self.frames = {}
+        self.page_classes = {F.__name__: F for F in (MainPage, ModLoader, ModBrowser, ModPage, Settings, Groovy, Glooby)}
+        self.current_page = None
         self.withdraw()
         self.title("Split Modding Program")
         self.geometry("1280x720")
@@ -1269,27 +3873,378 @@ class App(tk.Tk):
         default_mod_values()
         splash.update_progress(1)
 
-        self.frames = {}
-        for i, F in enumerate((MainPage, ModLoader, ModPage, Settings, Groovy, Glooby), start=2):
-            page_name = F.__name__
-            splash.log(f"Initializing {page_name}...")
-            frame = F(self.container, self)
-            self.frames[page_name] = frame
-            frame.place(relwidth=1, relheight=1)
-            splash.update_progress(i)
+        splash.log("Initializing MainPage...")
+        self.get_frame("MainPage")
+        splash.update_progress(2)
 
         splash.log("Finalizing setup...")
         splash.update_progress(len(LOADING_STEPS))
         self.show_frame("MainPage")
 
+        if load_split_config().getboolean("Display", "prewarm_pages", fallback=True):
+            self.after(PREWARM_DELAY_MS, self.prewarm_frames, list(PREWARM_PAGES))
+
+    def get_frame(self, page_name):
+        """Returns the page called page_name, building it the first time it's needed."""
+        frame = self.frames.get(page_name)
+        if frame is None:
+            frame = self.page_classes[page_name](self.container, self)
+            frame.place(relwidth=1, relheight=1)
+            # New widgets stack on top of their siblings; keep it behind the page being shown
+            frame.lower()
+            self.frames[page_name] = frame
+        return frame
+
+    def prewarm_frames(self, pending):
+        """Builds the pending pages one at a time, handing control back to Tk in between so the menu stays responsive."""
+        if not pending:
+            return
+        page_name = pending.pop(0)
+        try:
+            self.get_frame(page_name)
+        except Exception as e:
+            print(f"Failed to pre-build {page_name}: {e}")
+        self.after(PREWARM_DELAY_MS, self.prewarm_frames, pending)
+
+    def release_frame(self, page_name):
+        """Destroys a built page so its resources are freed. It is rebuilt the next time it's shown."""
+        frame = self.frames.pop(page_name, None)
+        if frame is None:
+            return
+        if hasattr(frame, "release"):
+            frame.release()
+        page_timers.forget(frame)
+        frame.destroy()
+
     def show_frame(self, page_name):
-        frame = self.frames[page_name]
+        """
+        Raises a page, building it if needed. The page being left gets on_hide() and its timers paused;
+        the new page gets update_content() and on_show() and its timers resumed.
+        """
+        previous = self.current_page
+        frame = self.get_frame(page_name)
+
+        previous_frame = self.frames.get(previous) if previous != page_name else None
+        if previous_frame is not None:
+            page_timers.pause(previous_frame)
+            if hasattr(previous_frame, "on_hide"):
+                previous_frame.on_hide()
+
         if hasattr(frame, 'update_content'):
             frame.update_content()
         frame.tkraise()
+        self.current_page = page_name
+        if hasattr(frame, "on_show"):
+            frame.on_show()
+        page_timers.resume(frame)
+
+        # Pages holding heavy resources (video decoders, big animations) are dropped when left
+        if previous and previous != page_name and getattr(self.frames.get(previous), "release_on_hide", False):
+            self.release_frame(previous)
+
+
+# ─────────────
+# Command Line
+# ─────────────
+
+def resolve_mod_path(name, mods_path=None):
+    """Finds a mod folder by path, by folder name under mods/ or by its mod.ini name. Returns None if not found."""
+    if os.path.isdir(name):
+        return os.path.abspath(name)
+
+    mods_path = mods_path or MODS_PATH
+    if os.path.isdir(os.path.join(mods_path, name)):
+        return os.path.join(mods_path, name)
+
+    for mod in scan_mods(mods_path):
+        if mod["name"].lower() == name.lower() and mod.get("mod_path"):
+            return mod["mod_path"]
+    return None
+
+
+def cli_game_dir(args):
+    """Returns the game directory from --game-dir or split.ini, or None after printing an error."""
+    game_dir = args.game_dir or load_split_config().get("Paths", "game_dir", fallback="")
+    if not game_dir or not os.path.isdir(game_dir):
+        print("Invalid or missing game_dir. Set it in split.ini or pass --game-dir.", file=sys.stderr)
+        return None
+    return game_dir
+
+
+def cli_pipeline(args):
+    """Builds a PatchPipeline for the mod named on the command line, or returns None after printing an error."""
+    mod_path = resolve_mod_path(args.mod)
+    if not mod_path:
+        print(f"Mod not found: {args.mod}", file=sys.stderr)
+        return None
+
+    game_dir = cli_game_dir(args)
+    if not game_dir:
+        return None
+
+    return PatchPipeline(
+        mod_path,
+        game_dir,
+        on_progress=lambda step, label: label and print(f"── {label} ──"),
+        on_message=lambda kind, title, message: print(f"{title}: {message}", file=sys.stderr)
+    )
+
+
+def cli_patch(args):
+    pipeline = cli_pipeline(args)
+    if not pipeline or not pipeline.patch():
+        return 1
+    if not any(report["result"] for report in pipeline.patch_report):
+        print("No patches applied. Run 'restore' to remove the staged mod files.", file=sys.stderr)
+        return 1
+    print("Game is patched. Run 'restore' to put the original files back.")
+    return 0
+
+
+def cli_launch(args):
+    pipeline = cli_pipeline(args)
+    if not pipeline:
+        return 1
+    return 0 if pipeline.run() else 1
+
+
+def cli_restore(args):
+    game_dir = cli_game_dir(args)
+    if not game_dir:
+        return 1
+    restored = recover_game_files(game_dir)
+    unstaged = unstage_mod_assets(game_dir)
+    unresolved = (load_session(game_dir) or {}).get("backups", [])
+    if unresolved:
+        print(f"Unverified backups left in place: {', '.join(entry['backup'] for entry in unresolved)}", file=sys.stderr)
+        return 1
+    if not restored and not unstaged:
+        print("Nothing to restore.")
+    return 0
+
+
+def cli_verify(args):
+    mod_path = resolve_mod_path(args.mod)
+    if not mod_path:
+        print(f"Mod not found: {args.mod}", file=sys.stderr)
+        return 1
+    game_dir = cli_game_dir(args)
+    if not game_dir:
+        return 1
+
+    if args.write:
+        if os.path.exists(os.path.join(mod_path, MOD_MANIFEST)) and not args.force:
+            print(f"{MOD_MANIFEST} already exists in mod. Use --force to replace it.", file=sys.stderr)
+            return 1
+        manifest = build_mod_manifest(mod_path, game_dir)
+        print(f"Wrote {len(manifest)} patch(es) to {os.path.join(mod_path, MOD_MANIFEST)}")
+        return 0
+
+    results = verify_mod_manifest(mod_path, game_dir)
+    if not results:
+        print(f"No {MOD_MANIFEST} in mod. Create one with: verify --write")
+        return 1
+    for patch_name, ok, message in results:
+        print(f"{'OK  ' if ok else 'FAIL'} {patch_name}: {message}")
+    return 0 if all(ok for _, ok, _ in results) else 1
+
+
+def cli_scan(args):
+    mods = scan_mods(MODS_PATH, thumbnail_size=THUMBNAIL_SIZE if args.thumbnails else None)
+    for mod in mods:
+        print(f"{mod['name']}\t{mod.get('mod_path', '')}")
+    print(f"{len(mods)} mod(s) found.")
+    return 0
+
+
+def cli_clean_po(args):
+    game_dir = cli_game_dir(args)
+    if not game_dir:
+        return 1
+    paths = clean_po_files(game_dir, dry_run=args.dry_run, rebuild=args.rebuild)
+    for rel_path in paths:
+        print(rel_path)
+    print(f"{'Would delete' if args.dry_run else 'Deleted'} {len(paths)} .po file(s).")
+    return 0
+
+
+def cli_convert(args):
+    if args.folders:
+        jobs, skipped = [], []
+        for folder in args.folders:
+            mod_dir = resolve_mod_path(folder)
+            if not mod_dir:
+                skipped.append((folder, "mod not found"))
+                continue
+            try:
+                mod_id = detect_mod_id(mod_dir)
+            except Exception as e:
+                skipped.append((mod_dir, f"unreadable mod.ini: {e}"))
+                continue
+            if mod_id:
+                jobs.append((mod_dir, mod_id))
+            else:
+                skipped.append((mod_dir, "no GameBanana ID found"))
+    else:
+        jobs, skipped = find_conversion_jobs(MODS_PATH, args.csv)
+
+    def on_result(result):
+        folder = os.path.basename(os.path.normpath(result["mod_dir"]))
+        print(f"{'Failed' if result['error'] else 'Converted'}: {folder} ({result['seconds']:.1f}s)")
+
+    results = convert_mods(jobs, workers=args.workers, on_result=on_result)
+    print(conversion_report(results, skipped))
+    return 1 if any(result["error"] for result in results) else 0
+
+
+def cli_refresh_stats(args):
+    def on_result(result):
+        print(f"{result['status'].capitalize()}: {os.path.basename(os.path.normpath(result['mod_dir']))}")
+
+    results = refresh_mod_stats(find_stats_jobs(MODS_PATH), workers=args.workers, max_age=args.max_age * 60, on_result=on_result)
+    print(stats_report(results))
+    return 1 if any(result["error"] for result in results) else 0
+
+
+def cli_clear_cache(args):
+    freed = clear_image_cache() + clear_cache_dir(PATCH_CACHE_DIR)
+    print(f"Freed {freed / (1024 * 1024):.1f} MB.")
+    return 0
+
+
+STARTUP_BUDGET_MS = 400
+STARTUP_BENCH_PATH = os.path.join(CACHE_DIR, "startup_bench.jsonl")
+
+
+def measure_startup(runs=5):
+    """
+    Imports this script in fresh interpreters (without running the app) and measures the cost.
+    Returns {"median_ms", "heavy", "slowest"}: the median wall time, any HEAVY_MODULES the
+    script imported at startup, and the slowest top-level imports reported by -X importtime.
+    """
+    code = (
+        "import runpy, sys; before = set(sys.modules); "
+        f"runpy.run_path({os.path.abspath(__file__)!r}, run_name='split_bench'); "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in before))"
+    )
+    timings = []
+    heavy = []
+    slowest = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        heavy = [m for m in result.stdout.strip().split(",") if m]
+
+        imports = []
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith("  "):
+                imports.append((int(parts[1]) / 1000, parts[2].strip()))
+        slowest = sorted(imports, reverse=True)[:8]
+
+    timings.sort()
+    return {"median_ms": timings[len(timings) // 2], "heavy": heavy, "slowest": slowest}
+
+
+def cli_bench_startup(args):
+    result = measure_startup(args.runs)
+
+    previous = None
+    try:
+        with open(STARTUP_BENCH_PATH, "r", encoding="utf-8") as f:
+            previous = json.loads(f.readlines()[-1])
+    except (OSError, ValueError, IndexError):
+        pass
+
+    print(f"Startup: {result['median_ms']:.0f} ms (median of {args.runs}, budget {args.budget} ms)")
+    if previous:
+        print(f"Previous run: {previous['median_ms']:.0f} ms")
+    for ms, name in result["slowest"]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(STARTUP_BENCH_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"time": time.time(), "median_ms": result["median_ms"], "heavy": result["heavy"]}) + "\n")
+    except OSError as e:
+        print(f"Failed to record benchmark: {e}")
+
+    if result["heavy"]:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(result['heavy'])}")
+        return 1
+    if result["median_ms"] > args.budget:
+        print("FAIL: startup is over budget")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """
+    Headless entry point: patches, launches and inspects mods without starting Tk.
+    Returns the process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="split", description="Split Modding Program command line.")
+    parser.add_argument("--game-dir", help="game directory (defaults to game_dir in split.ini)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("patch", help="patch the game with a mod without launching it")
+    command.add_argument("mod", help="mod folder, folder name under mods/ or mod name")
+    command.set_defaults(func=cli_patch)
+
+    command = commands.add_parser("launch", help="patch, launch and restore once the game exits")
+    command.add_argument("mod", help="mod folder, folder name under mods/ or mod name")
+    command.set_defaults(func=cli_launch)
+
+    command = commands.add_parser("restore", help="put back game files left patched by 'patch' or a crash")
+    command.set_defaults(func=cli_restore)
+
+    command = commands.add_parser("verify", help="check game files against a mod's manifest.ini")
+    command.add_argument("mod", help="mod folder, folder name under mods/ or mod name")
+    command.add_argument("--write", action="store_true", help="create manifest.ini from the unmodified game")
+    command.add_argument("--force", action="store_true", help="with --write, replace an existing manifest.ini")
+    command.set_defaults(func=cli_verify)
+
+    command = commands.add_parser("scan", help="list mods and refresh the mod catalog")
+    command.add_argument("--thumbnails", action="store_true", help="also pre-render thumbnails into the cache")
+    command.set_defaults(func=cli_scan)
+
+    command = commands.add_parser("clean-po", help="delete leftover .po files from the game directory")
+    command.add_argument("--dry-run", action="store_true", help="list the files without deleting them")
+    command.add_argument("--rebuild", action="store_true", help="re-walk the game instead of using the index")
+    command.set_defaults(func=cli_clean_po)
+
+    command = commands.add_parser("convert", help="write mod.ini and thumbnail.jpg for many mods from GameBanana")
+    command.add_argument("folders", nargs="*", help="mod folders to convert (default: every folder in mods/)")
+    command.add_argument("--csv", help="CSV of folder,mod_id rows instead of detecting IDs")
+    command.add_argument("--workers", type=int, default=CONVERT_WORKERS, help="mods converted at once")
+    command.set_defaults(func=cli_convert)
+
+    command = commands.add_parser("refresh-stats", help="update like and download counts in every mod.ini")
+    command.add_argument("--workers", type=int, default=CONVERT_WORKERS, help="profiles fetched at once")
+    command.add_argument("--max-age", type=float, default=STATS_MAX_AGE_MINUTES,
+                         help="minutes a cached profile counts as fresh (0 always refetches)")
+    command.set_defaults(func=cli_refresh_stats)
+
+    command = commands.add_parser("clear-cache", help="delete cached thumbnails and patched files")
+    command.set_defaults(func=cli_clear_cache)
+
+    command = commands.add_parser("bench-startup", help="measure import cost and fail if it creeps up")
+    command.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to time")
+    command.add_argument("--budget", type=int, default=STARTUP_BUDGET_MS, help="allowed median startup in ms")
+    command.set_defaults(func=cli_bench_startup)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main(sys.argv[1:]))
+
     app = App()
     splash = LoadingScreen(app, total_steps=len(LOADING_STEPS))
     app.after(100, lambda: (